@@ -113,7 +113,7 @@ async def download(id):
     
     result = await crawler.download_source(id)
     
-    if ERROR in result:
+    if 'error' in result:
         raise ResourceNotFoundError(f"Error: {result['error']}")
     
     # Show file listing
@@ -13,7 +13,7 @@ from oarc_utils.errors import NetworkError
 
 from oarc_crawlers.config.config import apply_config_file
 from oarc_crawlers.core.crawlers.ddg_crawler import DDGCrawler
-from oarc_crawlers.utils.const import ERROR, SUCCESS
+from oarc_crawlers.utils.const import SUCCESS
 from oarc_crawlers.cli.help_texts import (
     ARGS_CONFIG_HELP,
     ARGS_MAX_RESULTS_HELP,
@@ -191,7 +191,7 @@ async def news(query, max_results):
     
     result = await crawler.news_search(query, max_results=max_results)
     
-    if ERROR in result:
+    if 'error' in result:
         raise NetworkError(f"News search failed: {result['error']}")
     
     log.debug(f"Got {len(result.get('results', []))} news results")
@@ -12,7 +12,7 @@ from oarc_utils.errors import OARCError
 
 from oarc_crawlers.config.config import apply_config_file
 from oarc_crawlers.core.crawlers.yt_crawler import YTCrawler
-from oarc_crawlers.utils.const import SUCCESS, ERROR
+from oarc_crawlers.utils.const import SUCCESS
 from oarc_crawlers.cli.help_texts import (
     ARGS_VERBOSE_HELP,
     ARGS_CONFIG_HELP,
@@ -153,7 +153,7 @@ async def playlist(url, format, max_videos, output_path):
             output_path=output_path
         )
     
-    if ERROR in result:
+    if 'error' in result:
         raise OARCError(f"Error: {result['error']}")
     
     video_count = len(result.get('videos', []))
@@ -201,7 +201,7 @@ async def captions(url, languages):
     
     result = await crawler.extract_captions(url=url, languages=lang_list)
     
-    if ERROR in result:
+    if 'error' in result:
         raise OARCError(f"Error: {result['error']}")
     
     caption_langs = list(result.get('captions', {}).keys())
@@ -252,7 +252,7 @@ async def search(query, limit):
     click.echo(f"Searching YouTube for: {query}")
     result = await crawler.search_videos(query=query, limit=limit)
     
-    if ERROR in result:
+    if 'error' in result:
         raise OARCError(f"Error: {result['error']}")
     
     click.secho(f"✓ Found {result.get('result_count', 0)} videos", fg='green')
@@ -314,7 +314,7 @@ async def chat(video_id, max_messages, duration):
         duration=duration
     )
     
-    if ERROR in result:
+    if 'error' in result:
         raise OARCError(f"Error: {result['error']}")
     
     msg_count = result.get('message_count', 0)
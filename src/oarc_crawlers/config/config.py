@@ -113,6 +113,7 @@ class Config:
 
         # Ensure data_dir is a Path object
         cls._config[CONFIG_KEY_DATA_DIR] = pathlib.Path(cls._config[CONFIG_KEY_DATA_DIR]).resolve()
+        Paths.invalidate_default_base()
 
         log.debug(f"Initialized Config with: {cls._config}")
 
@@ -170,7 +171,7 @@ class Config:
 
         # Otherwise, search standard locations
         for path in Paths.get_default_config_locations():
-            if path.exists():
+            if os.path.isfile(path):
                 parser.read(path)
                 if CONFIG_SECTION in parser:
                     log.debug(f"Loading config from default location: {path}")
@@ -201,6 +202,7 @@ class Config:
         # Make sure data_dir is a Path object
         if CONFIG_KEY_DATA_DIR in cls._config and isinstance(cls._config[CONFIG_KEY_DATA_DIR], str):
             cls._config[CONFIG_KEY_DATA_DIR] = pathlib.Path(cls._config[CONFIG_KEY_DATA_DIR]).resolve()
+        Paths.invalidate_default_base()
 
     @classmethod
     def load_from_file(cls, config_file: str) -> None:
@@ -315,6 +317,7 @@ class Config:
         # Handle special case for data_dir
         if key == CONFIG_KEY_DATA_DIR:
             cls._config[CONFIG_KEY_DATA_DIR] = pathlib.Path(value).resolve()
+            Paths.invalidate_default_base()
 
 
 # Export commonly used functions
@@ -286,6 +286,7 @@ class ConfigEditor:
         try:
             with open(config_file, 'w') as f:
                 parser.write(f)
+            Paths.invalidate_config_cache()
             
             echo(style("\nConfiguration saved successfully!", fg='green'))
             
@@ -178,6 +178,7 @@ class ConfigManager:
         # Write the config file
         with open(config_path, 'w') as f:
             parser.write(f)
+        Paths.invalidate_config_cache()
         
         return True
 
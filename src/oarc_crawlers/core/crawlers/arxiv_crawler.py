@@ -13,12 +13,14 @@ Author: @BorcherdingL
 Date: 4/10/2023
 """
 
+import asyncio
 import io
 import os
 import re
 import shutil
 import tarfile
 import tempfile
+import time
 import urllib.request
 from collections import Counter
 from datetime import datetime, UTC
@@ -33,12 +35,43 @@ from oarc_crawlers.core.storage.parquet_storage import ParquetStorage
 from oarc_crawlers.utils.crawler_utils import CrawlerUtils
 from oarc_crawlers.utils.const import (
     ARXIV_BASE_URL,
+    ARXIV_NETWORK_CONCURRENCY,
+    ARXIV_REQUEST_INTERVAL,
     ARXIV_SOURCE_URL_FORMAT,
     ARXIV_URL_PATTERNS,
 )
 from oarc_crawlers.utils.paths import Paths
 
 
+# Bare ArXiv IDs: new-style "1706.03762" or old-style "hep-th/9901001"
+_ARXIV_ID_RE = re.compile(r'^(?:\d+\.\d+|[a-z\-]+/\d+)$')
+# "arXiv:<id>" mentions inside a reference's citation text
+_ARXIV_CITATION_RE = re.compile(r'arxiv:(\d+\.\d+|[a-z\-]+/\d+)', re.IGNORECASE)
+
+
+def _read_url(url: str) -> bytes:
+    """Blocking download of ``url``; run via asyncio.to_thread."""
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+class _RateLimiter:
+    """Let at most one request start every ``interval`` seconds, across tasks."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self):
+        """Sleep until the next request slot is free, then claim it."""
+        async with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = time.monotonic() + self.interval
+
+
 class ArxivCrawler:
     """Class for searching and retrieving ArXiv papers."""
     
@@ -98,7 +131,7 @@ class ArxivCrawler:
             raise ValueError(f"Unrecognized ArXiv URL format: {arxiv_input}")
         
         # If it's already an ID, validate it
-        if re.match(r'^\d+\.\d+$', arxiv_input) or re.match(r'^[a-z\-]+/\d+$', arxiv_input):
+        if _ARXIV_ID_RE.match(arxiv_input):
             log.debug(f"Input is already a valid ArXiv ID: {arxiv_input}")
             return arxiv_input
             
@@ -121,7 +154,8 @@ class ArxivCrawler:
             )
             
             log.debug(f"Querying the arXiv API for paper with ID: {arxiv_id}")
-            results = list(search.results())
+            # The arxiv client blocks on HTTP; keep it off the event loop
+            results = await asyncio.to_thread(lambda: list(search.results()))
             
             if not results:
                 log.error(f"No paper found with ID: {arxiv_id}")
@@ -224,9 +258,8 @@ class ArxivCrawler:
             
             # Download the source tarball
             log.debug("Sending request to download source files")
-            with urllib.request.urlopen(source_url) as response:
-                tar_data = response.read()
-                log.debug(f"Downloaded {len(tar_data)} bytes of source data")
+            tar_data = await asyncio.to_thread(_read_url, source_url)
+            log.debug(f"Downloaded {len(tar_data)} bytes of source data")
             
             # Check if this is a tar file
             source_content = {}
@@ -745,6 +778,34 @@ class ArxivCrawler:
         
         return result
 
+    async def _fetch_network_paper(self, paper_id: str, semaphore: asyncio.Semaphore,
+                                   limiter: _RateLimiter):
+        """Fetch a paper's info and references for generate_citation_network.
+        
+        Each of the two arXiv requests (API query, then e-print download) first
+        waits for a slot from ``limiter``.
+        
+        Returns:
+            tuple: ``(paper_info, references)``; ``paper_info`` is None if the paper could not be fetched
+        """
+        async with semaphore:
+            try:
+                await limiter.wait()
+                paper_info = await self.fetch_paper_info(paper_id)
+            except Exception as e:
+                log.error(f"Error processing paper {paper_id}: {e}")
+                return None, None
+            if 'error' in paper_info:
+                return None, None
+            
+            try:
+                await limiter.wait()
+                references = await self.extract_references(paper_id)
+            except Exception as e:
+                log.error(f"Error extracting references for {paper_id}: {e}")
+                references = None
+            return paper_info, references
+
     async def generate_citation_network(self, seed_papers: List[str], max_depth: int = 1):
         """Generate a citation network starting from seed papers.
         
@@ -755,7 +816,8 @@ class ArxivCrawler:
             max_depth (int): How many layers of references to follow
             
         Returns:
-            dict: Dictionary containing the citation network
+            dict: Dictionary containing the citation network; ``stats['failed_count']``
+                counts papers whose info or references could not be fetched
         """
         log.debug(f"Generating citation network from {len(seed_papers)} seed papers")
         
@@ -764,66 +826,80 @@ class ArxivCrawler:
             'edges': [],  # References as edges
         }
         
-        papers_to_process = [(paper_id, 0) for paper_id in seed_papers]  # (paper_id, depth)
+        # Crawl one depth level at a time; papers within a level are fetched
+        # concurrently, at most ARXIV_NETWORK_CONCURRENCY at once. Every task
+        # shares one limiter, so arXiv sees one request per ARXIV_REQUEST_INTERVAL.
+        semaphore = asyncio.Semaphore(ARXIV_NETWORK_CONCURRENCY)
+        limiter = _RateLimiter(ARXIV_REQUEST_INTERVAL)
         processed_papers = set()
-        
-        while papers_to_process:
-            current_id, current_depth = papers_to_process.pop(0)
-            
-            if current_id in processed_papers or current_depth > max_depth:
-                continue
-                
-            processed_papers.add(current_id)
+        frontier = list(dict.fromkeys(seed_papers))
+        current_depth = 0
+        failed_count = 0
+        
+        while frontier and current_depth <= max_depth:
+            processed_papers.update(frontier)
+            fetched = await asyncio.gather(
+                *(self._fetch_network_paper(paper_id, semaphore, limiter) for paper_id in frontier)
+            )
+            next_frontier = []
+            level_failed = failed_count
             
-            try:
-                # Get paper info
-                paper_info = await self.fetch_paper_info(current_id)
-                if 'error' in paper_info:
+            for current_id, (paper_info, references) in zip(frontier, fetched, strict=True):
+                if paper_info is None:
+                    failed_count += 1
                     continue
+                if references is None or 'error' in references:
+                    failed_count += 1
                 
-                # Add node to network
-                network['nodes'][current_id] = {
-                    'title': paper_info['title'],
-                    'authors': paper_info['authors'],
-                    'published': paper_info['published'],
-                    'categories': paper_info.get('categories', []),
-                    'depth': current_depth
-                }
-                
-                # Get references
-                references = await self.extract_references(current_id)
-                if 'error' in references or not references.get('references'):
-                    continue
-                
-                # Process references
-                for ref in references['references']:
-                    ref_key = ref.get('key', '')
-                    ref_citation = ref.get('citation', '')
+                try:
+                    # Add node to network
+                    network['nodes'][current_id] = {
+                        'title': paper_info['title'],
+                        'authors': paper_info['authors'],
+                        'published': paper_info['published'],
+                        'categories': paper_info.get('categories', []),
+                        'depth': current_depth
+                    }
                     
-                    if ref_key:
-                        # Add edge to network
-                        edge = {
-                            'source': current_id,
-                            'target': ref_key,
-                            'citation': ref_citation
-                        }
-                        network['edges'].append(edge)
+                    if not references or 'error' in references or not references.get('references'):
+                        continue
                     
-                    # If we haven't reached max depth, add reference to queue for processing
-                    if current_depth < max_depth:
-                        # Try to extract arXiv ID from citation if possible
-                        arxiv_match = re.search(r'arxiv:(\d+\.\d+|[a-z\-]+/\d+)', ref_citation, re.IGNORECASE)
-                        if arxiv_match:
-                            ref_arxiv_id = arxiv_match.group(1)
-                            papers_to_process.append((ref_arxiv_id, current_depth + 1))
+                    # Process references
+                    for ref in references['references']:
+                        ref_key = ref.get('key', '')
+                        ref_citation = ref.get('citation', '')
+                        
+                        if ref_key:
+                            # Add edge to network
+                            edge = {
+                                'source': current_id,
+                                'target': ref_key,
+                                'citation': ref_citation
+                            }
+                            network['edges'].append(edge)
+                        
+                        # If we haven't reached max depth, queue the reference for the next level
+                        if current_depth < max_depth:
+                            # Try to extract arXiv ID from citation if possible
+                            arxiv_match = _ARXIV_CITATION_RE.search(ref_citation)
+                            if arxiv_match and arxiv_match.group(1) not in processed_papers:
+                                next_frontier.append(arxiv_match.group(1))
+                
+                except Exception as e:
+                    log.error(f"Error processing paper {current_id}: {e}")
             
-            except Exception as e:
-                log.error(f"Error processing paper {current_id}: {e}")
+            level_failed = failed_count - level_failed
+            if level_failed:
+                log.warning(f"Depth {current_depth}: {level_failed} of {len(frontier)} paper(s) "
+                            "could not be fully fetched")
+            frontier = list(dict.fromkeys(next_frontier))
+            current_depth += 1
         
         # Add network stats
         network['stats'] = {
             'node_count': len(network['nodes']),
             'edge_count': len(network['edges']),
+            'failed_count': failed_count,
             'max_depth': max_depth,
             'timestamp': datetime.now(UTC).isoformat()
         }
@@ -831,6 +907,6 @@ class ArxivCrawler:
         # Save network to file using Paths API
         timestamp = int(datetime.now().timestamp())
         net_path = Paths.arxiv_network_path(self.data_dir, timestamp)
-        ParquetStorage.save_to_parquet(network, str(net_path))
+        await asyncio.to_thread(ParquetStorage.save_to_parquet, network, str(net_path))
         
         return network
\ No newline at end of file
@@ -24,6 +24,7 @@ from oarc_utils.errors import (
 
 from oarc_crawlers.core.storage.parquet_storage import ParquetStorage
 from oarc_crawlers.config.config import Config
+from oarc_crawlers.utils.const import WEB_CONNECTIONS_PER_HOST, WEB_DNS_CACHE_TTL
 from oarc_crawlers.utils.paths import Paths
 
 class WebCrawler:
@@ -40,8 +41,21 @@ class WebCrawler:
             data_dir = str(Config().data_dir)
         self.data_dir = data_dir
         self.crawl_data_dir = Paths.web_crawls_dir(self.data_dir)
+        self._session = None
         log.debug(f"Initialized WebCrawler with data directory: {self.data_dir}")
     
+    async def __aenter__(self):
+        """Open a pooled HTTP session shared by requests made inside the block."""
+        connector = aiohttp.TCPConnector(limit_per_host=WEB_CONNECTIONS_PER_HOST,
+                                         ttl_dns_cache=WEB_DNS_CACHE_TTL)
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared session."""
+        session, self._session = self._session, None
+        await session.close()
+    
     async def fetch_url_content(self, url):
         """Fetch content from a URL.
         
@@ -61,36 +75,44 @@ class WebCrawler:
         
         log.debug(f"Starting HTTP request to {url} with headers: {headers}")
         
+        # Inside ``async with crawler:`` reuse its pooled session; otherwise
+        # use a one-off session for this request
+        if self._session is not None:
+            return await self._fetch_with_session(self._session, url, headers)
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                log.debug(f"Received response with status code: {response.status}, content-type: {response.headers.get('content-type')}")
+            return await self._fetch_with_session(session, url, headers)
+    
+    async def _fetch_with_session(self, session, url, headers):
+        """Fetch ``url`` through ``session`` and save the crawl; see fetch_url_content."""
+        async with session.get(url, headers=headers) as response:
+            log.debug(f"Received response with status code: {response.status}, content-type: {response.headers.get('content-type')}")
+            
+            if response.status == 200:
+                html = await response.text()
+                log.debug(f"Successfully fetched {len(html)} bytes of HTML content")
+                
+                # Save crawled content
+                crawl_data = {
+                    'url': url,
+                    'timestamp': datetime.now(UTC).isoformat(),
+                    'content': html[:100000]  # Limit content size
+                }
                 
-                if response.status == 200:
-                    html = await response.text()
-                    log.debug(f"Successfully fetched {len(html)} bytes of HTML content")
-                    
-                    # Save crawled content
-                    crawl_data = {
-                        'url': url,
-                        'timestamp': datetime.now(UTC).isoformat(),
-                        'content': html[:100000]  # Limit content size
-                    }
-                    
-                    # Generate a filename from the URL
-                    filename = re.sub(r'[^\w]', '_', url.split('//')[-1])[:50]
-                    file_path = f"{self.data_dir}/crawls/{filename}_{int(datetime.now().timestamp())}.parquet"
-                    log.debug(f"Saving crawl data to: {file_path}")
-                    
-                    # Ensure directory exists
-                    Path(f"{self.data_dir}/crawls").mkdir(parents=True, exist_ok=True)
-                    
-                    # Save the data
-                    ParquetStorage.save_to_parquet(crawl_data, file_path)
-                    
-                    return html
-                else:
-                    log.debug(f"Request failed with status code {response.status}")
-                    raise ResourceNotFoundError(f"Failed to fetch URL {url}: HTTP Status {response.status}")
+                # Generate a filename from the URL
+                filename = re.sub(r'[^\w]', '_', url.split('//')[-1])[:50]
+                file_path = f"{self.data_dir}/crawls/{filename}_{int(datetime.now().timestamp())}.parquet"
+                log.debug(f"Saving crawl data to: {file_path}")
+                
+                # Ensure directory exists
+                Path(f"{self.data_dir}/crawls").mkdir(parents=True, exist_ok=True)
+                
+                # Save the data
+                ParquetStorage.save_to_parquet(crawl_data, file_path)
+                
+                return html
+            else:
+                log.debug(f"Request failed with status code {response.status}")
+                raise ResourceNotFoundError(f"Failed to fetch URL {url}: HTTP Status {response.status}")
 
     @staticmethod
     async def extract_text_from_html(html):
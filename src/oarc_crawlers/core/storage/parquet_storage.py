@@ -33,21 +33,27 @@ Date: 4/18/2025
 """
 
 import os
-import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
-from typing import Union, Optional, Dict, List, Sequence
+from typing import TYPE_CHECKING, Union, Optional, Dict, List, Sequence
 
 from oarc_log import log
 from oarc_utils.errors import DataExtractionError
 
 from oarc_crawlers.utils.paths import Paths, PathLike
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas and pyarrow are imported inside the methods that need them so that
+# importing this module (and the CLI that pulls it in) stays cheap.
+
+# Arrow memory pool installed on first save (see ParquetStorage._memory_pool)
+_ARROW_POOL = None
+
 class ParquetStorage:
     """"Utility class for saving and loading data in Parquet format."""
     
     @staticmethod
-    def save_to_parquet(data: Union[Dict, List, pd.DataFrame], file_path: PathLike) -> bool:
+    def save_to_parquet(data: Union[Dict, List, "pd.DataFrame"], file_path: PathLike) -> bool:
         """Save data to a Parquet file.
         
         Args:
@@ -59,6 +65,10 @@ class ParquetStorage:
         """
         log.debug(f"Saving data to Parquet file: {file_path}")
         
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
         try:
             # Use Paths directly instead of StorageUtils
             if not Paths.is_valid_path(file_path):
@@ -83,8 +93,10 @@ class ParquetStorage:
                 log.error(f"Unsupported data type: {type(data)}")
                 return False
                 
-            # Save to Parquet
-            pq.write_table(pa.Table.from_pandas(df), str(file_path))
+            # Save to Parquet; Parquet dictionary-encodes every column by default
+            ParquetStorage._memory_pool()
+            table = ParquetStorage._dictionary_encode_string_lists(pa.Table.from_pandas(df))
+            pq.write_table(table, str(file_path))
             log.debug(f"Successfully saved data to {file_path}")
             return True
         except Exception as e:
@@ -92,7 +104,57 @@ class ParquetStorage:
             return False
             
     @staticmethod
-    def load_from_parquet(file_path: PathLike) -> Optional[pd.DataFrame]:
+    def _memory_pool():
+        """Install and return the Arrow memory pool used when building tables.
+        
+        Prefers jemalloc, then mimalloc, since both handle large Arrow buffers
+        better than the system allocator. Falls back to Arrow's default pool
+        when neither is compiled into the installed pyarrow. The pool is set
+        as Arrow's process-wide default once, on the first call.
+        
+        Returns:
+            pyarrow.MemoryPool: The selected memory pool
+        """
+        global _ARROW_POOL
+        if _ARROW_POOL is None:
+            import pyarrow as pa
+            
+            for factory in (pa.jemalloc_memory_pool, pa.mimalloc_memory_pool):
+                try:
+                    _ARROW_POOL = factory()
+                    break
+                except NotImplementedError:
+                    continue
+            else:
+                _ARROW_POOL = pa.default_memory_pool()
+            pa.set_memory_pool(_ARROW_POOL)
+            log.debug(f"Using Arrow memory pool: {_ARROW_POOL.backend_name}")
+        return _ARROW_POOL
+    
+    @staticmethod
+    def _dictionary_encode_string_lists(table):
+        """Store list-of-string columns (e.g. video keywords) as lists of dictionary values.
+        
+        Tags repeat heavily across rows, so keeping each distinct string once
+        makes these columns far smaller. Reading the file back still yields
+        plain lists of strings.
+        
+        Args:
+            table: pyarrow Table built from the DataFrame being saved
+            
+        Returns:
+            pyarrow.Table: Table with list<string> columns re-typed
+        """
+        import pyarrow as pa
+        
+        target = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+        for i, field in enumerate(table.schema):
+            if pa.types.is_list(field.type) and pa.types.is_string(field.type.value_type):
+                table = table.set_column(i, field.with_type(target), table.column(i).cast(target))
+        return table
+            
+    @staticmethod
+    def load_from_parquet(file_path: PathLike) -> Optional["pd.DataFrame"]:
         """Load data from a Parquet file.
         
         Args:
@@ -110,6 +172,8 @@ class ParquetStorage:
             log.debug(f"Parquet file not found: {file_path}")
             return None
             
+        import pyarrow.parquet as pq
+        
         try:
             table = pq.read_table(str(file_path))
             df = table.to_pandas()
@@ -120,7 +184,7 @@ class ParquetStorage:
             raise DataExtractionError(f"Failed to load Parquet file: {str(e)}")
             
     @staticmethod
-    def append_to_parquet(data: Union[Dict, List, pd.DataFrame], file_path: PathLike) -> bool:
+    def append_to_parquet(data: Union[Dict, List, "pd.DataFrame"], file_path: PathLike) -> bool:
         """Append data to an existing Parquet file or create a new one.
         
         Args:
@@ -134,6 +198,8 @@ class ParquetStorage:
         
         # Load existing data if available
         if Paths.file_exists(file_path):
+            import pandas as pd
+            
             existing_df = ParquetStorage.load_from_parquet(file_path)
             if existing_df is None:
                 log.error(f"Failed to load existing file: {file_path}")
@@ -157,7 +223,7 @@ class ParquetStorage:
         return ParquetStorage.save_to_parquet(data, file_path)
 
     @staticmethod
-    def save_youtube_data(data: Union[Dict, List, pd.DataFrame], 
+    def save_youtube_data(data: Union[Dict, List, "pd.DataFrame"], 
                          video_id: Optional[str] = None,
                          data_type: str = "metadata",
                          base_dir: Optional[PathLike] = None) -> str:
@@ -201,7 +267,7 @@ class ParquetStorage:
             return ""
 
     @staticmethod
-    def save_github_data(data: Union[Dict, List, pd.DataFrame], 
+    def save_github_data(data: Union[Dict, List, "pd.DataFrame"], 
                         owner: str, 
                         repo: str,
                         base_dir: Optional[PathLike] = None) -> str:
@@ -7,7 +7,7 @@ VERBOSE_LOG_LEVEL = "DEBUG"
 # Status constants
 SUCCESS = 0
 FAILURE = 1
-ERROR = "error"
+ERROR = FAILURE  # exit code, not a result-dict key
 VERSION = "0.1.5"
 
 # Default values for configuration
@@ -65,6 +65,10 @@ DEFAULT_HEADERS = {
     "User-Agent": DEFAULT_USER_AGENT
 }
 
+# Connection pooling for a WebCrawler used as an async context manager
+WEB_CONNECTIONS_PER_HOST = 16
+WEB_DNS_CACHE_TTL = 300
+
 # URLs
 PYPI_PACKAGE_URL = "https://pypi.org/project/{package}/"
 PYPI_JSON_URL = "https://pypi.org/pypi/{package}/json"
@@ -122,6 +126,10 @@ ARXIV_MAX_REFERENCES = 200
 ARXIV_CATEGORY_MAX_RESULTS = 100
 ARXIV_CITATION_MAX_DEPTH = 1
 ARXIV_BATCH_CHUNK_SIZE = 10
+# Citation network crawls: papers in flight at once, and the minimum spacing
+# in seconds between requests to arXiv (its API asks for one every 3 seconds)
+ARXIV_NETWORK_CONCURRENCY = 3
+ARXIV_REQUEST_INTERVAL = 3.0
 
 # GitHub binary file extensions
 GITHUB_BINARY_EXTENSIONS = {
@@ -6,22 +6,45 @@ including URL handling, ID extraction, and standardized file operations.
 """
 
 import re
-from datetime import datetime, UTC
-from typing import Dict, Optional
-
-from pytube import YouTube
+import time
+from operator import itemgetter
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Optional
 
 from oarc_log import log
 from oarc_utils.errors import ResourceNotFoundError
 
 from oarc_crawlers.utils.const import (
     YOUTUBE_VIDEO_URL_FORMAT,
+    YOUTUBE_CHANNEL_URL_FORMAT,
     YOUTUBE_WATCH_PATTERN,
     YOUTUBE_SHORT_PATTERN,
     GITHUB_LANGUAGE_EXTENSIONS,
     NLTK_RESOURCES
 )
 
+if TYPE_CHECKING:
+    # Only needed for annotations; pytube is loaded by the YouTube crawler itself
+    from pytube import YouTube
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last timestamp built
+_TS_CACHE = (-1, "")
+
+# Chat message fields read by format_chat_message_for_file, in one C-level lookup
+_CHAT_MSG_FIELDS = itemgetter(
+    "is_verified", "is_chat_owner", "is_chat_sponsor", "is_chat_moderator",
+    "datetime", "author_name", "message"
+)
+
+# Author badge suffix for every verified/owner/sponsor/moderator combination,
+# indexed by a 4-bit mask (bit 0 = verified ... bit 3 = moderator)
+_CHAT_AUTHOR_TAGS = ("✓", "👑", "💰", "🛡️")
+_CHAT_AUTHOR_SUFFIXES = tuple(
+    f" ({', '.join(tag for bit, tag in enumerate(_CHAT_AUTHOR_TAGS) if mask >> bit & 1)})"
+    if mask else ""
+    for mask in range(1 << len(_CHAT_AUTHOR_TAGS))
+)
+
 class CrawlerUtils:
     """
     Utility methods for crawler operations across all OARC crawler modules.
@@ -79,9 +102,18 @@ class CrawlerUtils:
         Returns:
             Formatted timestamp string (UTC)
         """
-        if dt is None:
-            dt = datetime.now(UTC)
-        return dt.isoformat()
+        if dt is not None:
+            return dt.isoformat()
+        
+        # Same output as datetime.now(UTC).isoformat(), but the second-resolution
+        # prefix is only rebuilt when the wall-clock second changes.
+        global _TS_CACHE
+        sec, micro = divmod(time.time_ns() // 1000, 1_000_000)
+        if sec != _TS_CACHE[0]:
+            _TS_CACHE = (sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)))
+        if micro:
+            return f"{_TS_CACHE[1]}.{micro:06d}+00:00"
+        return f"{_TS_CACHE[1]}+00:00"
 
     @staticmethod
     def file_size_format(size_bytes: int) -> str:
@@ -104,7 +136,7 @@ class CrawlerUtils:
             return f"{size_bytes/(1024*1024*1024):.2f} GB"
             
     @staticmethod
-    def extract_video_info(youtube: YouTube) -> Dict:
+    def extract_video_info(youtube: "YouTube") -> Dict:
         """Extract metadata information from a YouTube object.
         
         Args:
@@ -116,21 +148,30 @@ class CrawlerUtils:
         Raises:
             DataExtractionError: If metadata extraction fails
         """
-        log.debug(f"Extracting metadata for video ID: {youtube.video_id}")
+        video_id = youtube.video_id
+        log.debug(f"Extracting metadata for video ID: {video_id}")
+        
+        # Read the parsed InnerTube payload once instead of going through the
+        # individual pytube properties, each of which re-walks vid_info.
+        details = youtube.vid_info.get('videoDetails', {})
+        thumbnails = details.get('thumbnail', {}).get('thumbnails')
+        length = details.get('lengthSeconds')
+        views = details.get('viewCount')
+        publish_date = youtube.publish_date
         
         video_info = {
-            'title': youtube.title,
-            'video_id': youtube.video_id,
-            'url': f"https://www.youtube.com/watch?v={youtube.video_id}",
-            'author': youtube.author,
-            'channel_url': youtube.channel_url,
-            'description': youtube.description,
-            'length': youtube.length,
-            'publish_date': youtube.publish_date.isoformat() if youtube.publish_date else None,
-            'views': youtube.views,
-            'rating': youtube.rating,
-            'thumbnail_url': youtube.thumbnail_url,
-            'keywords': youtube.keywords,
+            'title': details.get('title'),
+            'video_id': video_id,
+            'url': YOUTUBE_VIDEO_URL_FORMAT.format(video_id=video_id),
+            'author': details.get('author', 'unknown'),
+            'channel_url': YOUTUBE_CHANNEL_URL_FORMAT.format(channel_id=details.get('channelId')),
+            'description': details.get('shortDescription'),
+            'length': int(length) if length is not None else None,
+            'publish_date': publish_date.isoformat() if publish_date else None,
+            'views': int(views) if views is not None else None,
+            'rating': details.get('averageRating'),
+            'thumbnail_url': thumbnails[-1]['url'] if thumbnails else youtube.thumbnail_url,
+            'keywords': details.get('keywords', []),
             'timestamp': CrawlerUtils.format_timestamp()
         }
         
@@ -138,7 +179,7 @@ class CrawlerUtils:
         return video_info
     
     @staticmethod
-    def select_stream(youtube: YouTube, video_format: str, resolution: str, extract_audio: bool):
+    def select_stream(youtube: "YouTube", video_format: str, resolution: str, extract_audio: bool):
         """Select the appropriate stream based on parameters.
         
         Args:
@@ -153,34 +194,39 @@ class CrawlerUtils:
         Raises:
             ResourceNotFoundError: If no suitable stream is found
         """
+
+        # Materialise the stream list once; every selection below is a pass over
+        # this list rather than a fresh StreamQuery.filter().order_by() chain.
+        streams = list(youtube.streams)
         
         if extract_audio:
-            stream = youtube.streams.filter(only_audio=True).first()
+            stream = next(
+                (s for s in streams if s.includes_audio_track and not s.includes_video_track), None)
             if not stream:
                 raise ResourceNotFoundError(f"No audio stream available for {youtube.video_id}")
             return stream
             
-        # Handle video streams
+        # Handle video streams: candidates in the requested container, highest resolution first
+        candidates = [s for s in streams if s.subtype == video_format and s.resolution]
+        candidates.sort(key=lambda s: int(s.resolution.rstrip('p')), reverse=True)
+        
+        stream = None
         if resolution == "highest":
             if video_format.lower() == "mp4":
-                stream = youtube.streams.filter(
-                    progressive=True, file_extension=video_format).order_by('resolution').desc().first()
-            else:
-                stream = youtube.streams.filter(
-                    file_extension=video_format).order_by('resolution').desc().first()
+                stream = next((s for s in candidates if s.is_progressive), None)
+            elif candidates:
+                stream = candidates[0]
         elif resolution == "lowest":
-            stream = youtube.streams.filter(
-                file_extension=video_format).order_by('resolution').asc().first()
+            if candidates:
+                stream = candidates[-1]
         else:
             # Try to get the specific resolution
-            stream = youtube.streams.filter(
-                res=resolution, file_extension=video_format).first()
+            stream = next((s for s in candidates if s.resolution == resolution), None)
             
             # Fall back to highest if specified resolution not available
-            if not stream:
+            if not stream and candidates:
                 log.debug(f"Resolution {resolution} not available, using highest available")
-                stream = youtube.streams.filter(
-                    file_extension=video_format).order_by('resolution').desc().first()
+                stream = candidates[0]
         
         # Check if a stream was found
         if not stream:
@@ -198,14 +244,9 @@ class CrawlerUtils:
         Returns:
             Formatted string representation
         """
-        author_tags = []
-        if msg["is_verified"]: author_tags.append("✓")
-        if msg["is_chat_owner"]: author_tags.append("👑")
-        if msg["is_chat_sponsor"]: author_tags.append("💰")
-        if msg["is_chat_moderator"]: author_tags.append("🛡️")
-        
-        author_suffix = f" ({', '.join(author_tags)})" if author_tags else ""
-        return f"[{msg['datetime']}] {msg['author_name']}{author_suffix}: {msg['message']}"
+        verified, owner, sponsor, moderator, dt, author, message = _CHAT_MSG_FIELDS(msg)
+        mask = bool(verified) | bool(owner) << 1 | bool(sponsor) << 2 | bool(moderator) << 3
+        return f"[{dt}] {author}{_CHAT_AUTHOR_SUFFIXES[mask]}: {message}"
     
     @staticmethod
     def sanitize_youtube_url(url: str) -> str:
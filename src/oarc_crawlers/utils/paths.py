@@ -3,18 +3,19 @@ Path utility functions for OARC Crawlers.
 
 This module provides standardized path management and helper functions
 for working with file system paths across the OARC Crawlers project.
+The helpers are plain module-level functions; the Paths class groups them
+under one name for existing callers.
 """
 
 import os
-import re
 import pathlib
+import functools
 import tempfile
+import time
 import shutil
-from datetime import datetime
-from typing import List, Optional, Union, Tuple
+from typing import Optional, Union, Tuple
 
 from oarc_log import log
-from oarc_utils.decorators import singleton
 
 from oarc_crawlers.utils.const import (
     ENV_DATA_DIR, 
@@ -36,569 +37,718 @@ from oarc_crawlers.utils.const import (
 
 PathLike = Union[str, pathlib.Path]
 
+# Constant path suffix, joined once here so helpers need a single os.path.join
+_OARC_CONFIG_SUFFIX = os.path.join(CONFIG_DIR, DEFAULT_CONFIG_FILENAME)
 
-@singleton
-class Paths:
-    """
-    Utility class for path management in OARC Crawlers.
+# Directories this process has already created; ensure_path skips mkdir for
+# these. set.add/discard are atomic under the GIL, so no lock is needed.
+_EXISTING_DIRS = set()
+
+# Config data_dir as a string, looked up on first use; see invalidate_default_base()
+_default_base: Optional[str] = None
+
+# Result of the last find_config_file() probe; _MISSING means "not probed yet"
+_MISSING = object()
+_config_path_cache = _MISSING
+
+# Maps characters that are not allowed in file names, plus spaces, to "_"
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '\\/*?:"<>| '})
+
+
+def _env_dir(value: str) -> pathlib.Path:
+    # Made absolute but not resolved: symlinks are kept as given, which
+    # saves a stat per path component
+    return pathlib.Path(value if os.path.isabs(value) else os.path.abspath(value))
+
+
+def _base_or_default(base_dir: Optional[PathLike]) -> str:
+    if base_dir is not None:
+        return os.fspath(base_dir)
+    global _default_base
+    if _default_base is None:
+        # Import here to avoid circular import
+        from oarc_crawlers.config.config import Config
+        _default_base = str(Config.get_instance().data_dir)
+    return _default_base
+
+
+# At most one mkdir per (base_dir, leaf) for the whole process
+@functools.lru_cache(maxsize=None)
+def _ensured_youtube_subdir(base_dir: str, leaf: str) -> pathlib.Path:
+    return ensure_path_leaf(_ensure_dir(os.path.join(base_dir, YOUTUBE_DATA_DIR)), leaf)
+
+
+def ensure_path(path: PathLike) -> pathlib.Path:
     """
+    Ensure a path exists and return it.
 
+    Args:
+        path: The path to ensure exists
 
-    @staticmethod
-    def ensure_path(path: PathLike) -> pathlib.Path:
-        """
-        Ensure a path exists and return it.
+    Returns:
+        Path: The ensured path
+    """
+    return pathlib.Path(_ensure_dir(os.fspath(path)))
 
-        Args:
-            path: The path to ensure exists
 
-        Returns:
-            Path: The ensured path
-        """
-        path_obj = pathlib.Path(path)
-        path_obj.mkdir(parents=True, exist_ok=True)
-        return path_obj
+def _ensure_dir(path: str) -> str:
+    # String-only core of ensure_path for helpers that keep paths as str
+    if path not in _EXISTING_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _EXISTING_DIRS.add(path)
+    return path
 
 
-    @staticmethod
-    def get_oarc_home_dir() -> pathlib.Path:
-        """
-        Get the OARC home directory.
-        
-        Uses the OARC_HOME_DIR environment variable if set,
-        otherwise defaults to the user's home directory.
-        
-        Returns:
-            Path: OARC home directory
-        """
-        if ENV_HOME_DIR in os.environ:
-            return pathlib.Path(os.environ[ENV_HOME_DIR]).resolve()
-        return pathlib.Path.home()
-
-
-    @staticmethod
-    def get_oarc_dir() -> pathlib.Path:
-        """
-        Get the .oarc directory.
-        
-        Returns:
-            Path: .oarc directory
-        """
-        return Paths.get_oarc_home_dir() / OARC_DIR
+def ensure_path_leaf(parent: PathLike, leaf: str) -> pathlib.Path:
+    """
+    Ensure a single directory exists inside an existing parent and return it.
 
+    Cheaper than ensure_path because it does not walk or create parents;
+    the caller guarantees that parent already exists.
 
-    @staticmethod
-    def get_default_data_dir() -> pathlib.Path:
-        """
-        Get the default data directory for OARC Crawlers.
+    Args:
+        parent: Existing parent directory
+        leaf: Name of the directory to create inside parent
 
-        Returns:
-            Path: Default data directory
-        """
-        # Check for environment variable first (highest priority)
-        if ENV_DATA_DIR in os.environ:
-            return pathlib.Path(os.environ[ENV_DATA_DIR]).resolve()
+    Returns:
+        Path: The ensured directory
+    """
+    key = os.path.join(parent, leaf)
+    if key not in _EXISTING_DIRS:
+        try:
+            os.mkdir(key)
+        except FileExistsError:
+            pass
+        _EXISTING_DIRS.add(key)
+    return pathlib.Path(key)
 
-        # Default to .oarc/data in the OARC home directory
-        return Paths.get_oarc_dir() / DATA_SUBDIR
 
+def reset_ensured_cache() -> None:
+    """Forget which directories ensure_path and the YouTube helpers have created."""
+    _EXISTING_DIRS.clear()
+    _ensured_youtube_subdir.cache_clear()
 
-    @staticmethod
-    def get_temp_dir() -> pathlib.Path:
-        """
-        Get a temporary directory for OARC Crawlers.
 
-        Returns:
-            Path: Temporary directory
-        """
-        temp_dir = pathlib.Path(tempfile.gettempdir()) / TEMP_DIR_PREFIX
-        return Paths.ensure_path(temp_dir)
+def _forget_dirs_under(path: PathLike) -> None:
+    # A removed tree must be recreated by the next ensure_path call
+    root = os.fspath(path)
+    prefix = os.path.join(root, "")
+    for key in [k for k in _EXISTING_DIRS if k == root or k.startswith(prefix)]:
+        _EXISTING_DIRS.discard(key)
+    _ensured_youtube_subdir.cache_clear()
 
 
-    @staticmethod
-    def sanitize_filename(name: str) -> str:
-        """
-        Sanitize a string to be used as a filename.
-        
-        Args:
-            name: The original filename
-            
-        Returns:
-            A sanitized filename
-        """
-        # Replace invalid characters with underscores
-        name = re.sub(r'[\\/*?:"<>|]', "_", name)
-        # Trim whitespace
-        name = name.strip()
-        # Replace spaces with underscores
-        name = name.replace(" ", "_")
-        # Limit length to prevent path too long errors
-        if len(name) > 250:
-            name = name[:250]
-        return name
+# The base directories below depend only on the environment, so they are
+# resolved once per process. Call clear_caches() after changing
+# OARC_HOME_DIR / OARC_DATA_DIR at runtime.
+@functools.lru_cache(maxsize=None)
+def get_oarc_home_dir() -> pathlib.Path:
+    """
+    Get the OARC home directory.
+    
+    Uses the OARC_HOME_DIR environment variable if set,
+    otherwise defaults to the user's home directory.
+    Relative values are made absolute, but symlinks are not resolved.
+    The result is cached; see clear_caches().
     
+    Returns:
+        Path: OARC home directory
+    """
+    if ENV_HOME_DIR in os.environ:
+        return _env_dir(os.environ[ENV_HOME_DIR])
+    return pathlib.Path(os.path.expanduser("~"))
 
-    @staticmethod
-    def timestamped_path(base_path: PathLike, name: str, extension: str = "") -> pathlib.Path:
-        """
-        Create a timestamped path to prevent overwrites.
-        
-        Args:
-            base_path: The base directory path
-            name: The base filename
-            extension: The file extension (optional)
-            
-        Returns:
-            A timestamped Path object
-        """
-        safe_name = Paths.sanitize_filename(name)
-        timestamp = int(datetime.now().timestamp())
-        
-        if extension and not extension.startswith('.'):
-            extension = f".{extension}"
-            
-        filename = f"{safe_name}_{timestamp}{extension}"
-        return pathlib.Path(base_path) / filename
+
+@functools.lru_cache(maxsize=None)
+def get_oarc_dir() -> pathlib.Path:
+    """
+    Get the .oarc directory.
     
+    Returns:
+        Path: .oarc directory
+    """
+    return get_oarc_home_dir() / OARC_DIR
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_data_dir() -> pathlib.Path:
+    """
+    Get the default data directory for OARC Crawlers.
 
-    @staticmethod
-    def is_valid_path(path: PathLike) -> bool:
-        """
-        Check if a path is valid and not potentially problematic.
+    Returns:
+        Path: Default data directory
+    """
+    # Check for environment variable first (highest priority)
+    if ENV_DATA_DIR in os.environ:
+        return _env_dir(os.environ[ENV_DATA_DIR])
+
+    # Default to .oarc/data in the OARC home directory
+    return get_oarc_dir() / DATA_SUBDIR
+
+
+def clear_caches() -> None:
+    """
+    Forget the cached home, .oarc and default data directories, and
+    which YouTube subdirectories have already been created.
+
+    Needed when OARC_HOME_DIR or OARC_DATA_DIR change after first use,
+    e.g. in tests that patch os.environ.
+    """
+    get_oarc_home_dir.cache_clear()
+    get_oarc_dir.cache_clear()
+    get_default_data_dir.cache_clear()
+    _fixed_config_locations.cache_clear()
+    _ensured_youtube_subdir.cache_clear()
+
+
+def invalidate_default_base() -> None:
+    """
+    Forget the cached Config data directory used when base_dir is None.
+
+    Called by Config whenever data_dir changes.
+    """
+    global _default_base
+    _default_base = None
+
+
+def get_temp_dir() -> pathlib.Path:
+    """
+    Get a temporary directory for OARC Crawlers.
+
+    Returns:
+        Path: Temporary directory
+    """
+    temp_dir = pathlib.Path(tempfile.gettempdir()) / TEMP_DIR_PREFIX
+    return ensure_path(temp_dir)
+
+
+# Owners, repo names and paper IDs repeat heavily during batch crawls
+@functools.lru_cache(maxsize=4096)
+def sanitize_filename(name: str) -> str:
+    """
+    Sanitize a string to be used as a filename.
+    
+    Args:
+        name: The original filename
         
-        Args:
-            path: The path to validate
-            
-        Returns:
-            bool: True if the path is valid, False otherwise
-        """
-        str_path = str(path)
+    Returns:
+        A sanitized filename
+    """
+    # Trim whitespace, then replace invalid characters and spaces in one pass
+    name = name.strip().translate(_SANITIZE_TABLE)
+    # Limit length to prevent path too long errors
+    return name[:250] if len(name) > 250 else name
+
+
+def timestamped_path(base_path: PathLike, name: str, extension: str = "") -> pathlib.Path:
+    """
+    Create a timestamped path to prevent overwrites.
+    
+    Args:
+        base_path: The base directory path
+        name: The base filename
+        extension: The file extension (optional)
         
-        # Handle absolute paths that might be invalid
-        if os.path.isabs(str_path):
-            dir_path = os.path.dirname(str_path)
-            
-            # For Windows, any path is valid unless specifically marked as invalid
-            if os.name == 'nt':
-                return '/invalid' not in dir_path.replace('\\', '/')
-                
-            # For Unix, check specific invalid paths
-            if dir_path.startswith('/invalid'):
-                return False
-                
-        return True
+    Returns:
+        A timestamped Path object
+    """
+    safe_name = sanitize_filename(name)
+    timestamp = time.time_ns() // 1_000_000_000
+    
+    if extension and not extension.startswith('.'):
+        extension = f".{extension}"
         
-    @staticmethod
-    def ensure_parent_dir(path: PathLike) -> Tuple[bool, str]:
-        """
-        Ensure the parent directory of a path exists.
+    filename = f"{safe_name}_{timestamp}{extension}"
+    return pathlib.Path(os.path.join(os.fspath(base_path), filename))
+
+
+def is_valid_path(path: PathLike) -> bool:
+    """
+    Check if a path is valid and not potentially problematic.
+    
+    Args:
+        path: The path to validate
         
-        Args:
-            path: The path whose parent directory should exist
-            
-        Returns:
-            Tuple[bool, str]: Success status and error message (if any)
-        """
-        try:
-            parent_dir = os.path.dirname(str(path))
-            if parent_dir:
-                Paths.ensure_path(parent_dir)
-            return True, ""
-        except (PermissionError, OSError) as e:
-            return False, str(e)
-
-    @staticmethod
-    def file_exists(file_path: PathLike) -> bool:
-        """
-        Check if a file exists.
+    Returns:
+        bool: True if the path is valid, False otherwise
+    """
+    str_path = str(path)
+    
+    # Handle absolute paths that might be invalid
+    if os.path.isabs(str_path):
+        dir_path = os.path.dirname(str_path)
         
-        Args:
-            file_path: The path to check
+        # For Windows, any path is valid unless specifically marked as invalid
+        if os.name == 'nt':
+            return '/invalid' not in dir_path.replace('\\', '/')
             
-        Returns:
-            bool: True if the file exists, False otherwise
-        """
-        return os.path.exists(str(file_path))
-
-    @staticmethod
-    def create_temp_dir(prefix: Optional[str] = None) -> pathlib.Path:
-        """
-        Create a temporary directory with an optional prefix.
-        
-        Args:
-            prefix: Optional prefix for the directory name
+        # For Unix, check specific invalid paths
+        if dir_path.startswith('/invalid'):
+            return False
             
-        Returns:
-            Path: Path to the created temporary directory
-        """
-        if prefix:
-            temp_dir = pathlib.Path(tempfile.mkdtemp(prefix=prefix))
-        else:
-            temp_dir = pathlib.Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX))
-        log.debug(f"Created temporary directory: {temp_dir}")
-        return temp_dir
+    return True
+
+
+def ensure_parent_dir(path: PathLike) -> Tuple[bool, str]:
+    """
+    Ensure the parent directory of a path exists.
+    
+    Args:
+        path: The path whose parent directory should exist
         
-    @staticmethod
-    def ensure_temp_dir(dir_path: Optional[PathLike] = None, prefix: Optional[str] = None) -> pathlib.Path:
-        """
-        Ensure a temporary directory exists, creating it if needed.
-        If dir_path is provided, use that path; otherwise create a new temp directory.
+    Returns:
+        Tuple[bool, str]: Success status and error message (if any)
+    """
+    try:
+        parent_dir = os.path.dirname(str(path))
+        if parent_dir:
+            ensure_path(parent_dir)
+        return True, ""
+    except (PermissionError, OSError) as e:
+        return False, str(e)
+
+
+def file_exists(file_path: PathLike) -> bool:
+    """
+    Check if a file exists.
+    
+    Args:
+        file_path: The path to check
         
-        Args:
-            dir_path: Path to use (optional)
-            prefix: Prefix for new temp dir if dir_path is None
-            
-        Returns:
-            Path: Path to the temporary directory
-        """
-        if dir_path is None:
-            return Paths.create_temp_dir(prefix)
-            
-        path_obj = pathlib.Path(dir_path)
-        if path_obj.exists():
-            shutil.rmtree(path_obj)
-        path_obj.mkdir(parents=True, exist_ok=True)
-        return path_obj
+    Returns:
+        bool: True if the file exists, False otherwise
+    """
+    return os.path.exists(str(file_path))
+
+
+def create_temp_dir(prefix: Optional[str] = None) -> pathlib.Path:
+    """
+    Create a temporary directory with an optional prefix.
+    
+    Args:
+        prefix: Optional prefix for the directory name
         
-    @staticmethod
-    def cleanup_temp_dir(temp_dir: PathLike) -> bool:
-        """
-        Remove a temporary directory and its contents.
+    Returns:
+        Path: Path to the created temporary directory
+    """
+    if prefix:
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix=prefix))
+    else:
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX))
+    log.debug(f"Created temporary directory: {temp_dir}")
+    return temp_dir
+
+
+def ensure_temp_dir(dir_path: Optional[PathLike] = None, prefix: Optional[str] = None) -> pathlib.Path:
+    """
+    Ensure a temporary directory exists, creating it if needed.
+    If dir_path is provided, use that path; otherwise create a new temp directory.
+    
+    Args:
+        dir_path: Path to use (optional)
+        prefix: Prefix for new temp dir if dir_path is None
         
-        Args:
-            temp_dir: Path to temporary directory to remove
-            
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        try:
-            if os.path.exists(str(temp_dir)):
-                shutil.rmtree(str(temp_dir))
-                log.debug(f"Removed temporary directory: {temp_dir}")
-                return True
-            return True  # Already doesn't exist, so consider it a success
-        except Exception as e:
-            log.error(f"Failed to remove temporary directory {temp_dir}: {str(e)}")
-            return False
-            
-    @staticmethod
-    def create_github_temp_dir(owner: str, repo_name: str) -> pathlib.Path:
-        """
-        Create a temporary directory specifically for GitHub repository operations.
+    Returns:
+        Path: Path to the temporary directory
+    """
+    if dir_path is None:
+        return create_temp_dir(prefix)
         
-        Args:
-            owner: Repository owner
-            repo_name: Repository name
-            
-        Returns:
-            Path: Path to the created temporary directory
-        """
-        prefix = f"github_repo_{owner}_{repo_name}_"
-        return Paths.create_temp_dir(prefix)
-
-    @staticmethod
-    def is_binary_file(file_path: str) -> bool:
-        """Check if a file is binary.
+    path_obj = pathlib.Path(dir_path)
+    if path_obj.exists():
+        shutil.rmtree(path_obj)
+        _forget_dirs_under(path_obj)
+    path_obj.mkdir(parents=True, exist_ok=True)
+    return path_obj
+
+
+def cleanup_temp_dir(temp_dir: PathLike) -> bool:
+    """
+    Remove a temporary directory and its contents.
+    
+    Args:
+        temp_dir: Path to temporary directory to remove
         
-        Args:
-            file_path (str): Path to the file
-            
-        Returns:
-            bool: True if file is binary, False otherwise
-        """
-        # Check extension first
-        _, ext = os.path.splitext(file_path.lower())
-        if ext in GITHUB_BINARY_EXTENSIONS:
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        if os.path.exists(str(temp_dir)):
+            shutil.rmtree(str(temp_dir))
+            _forget_dirs_under(temp_dir)
+            log.debug(f"Removed temporary directory: {temp_dir}")
             return True
-            
-        # Check file contents if needed and the file exists
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'rb') as f:
-                    chunk = f.read(1024)
-                    return b'\0' in chunk  # Binary files typically contain null bytes
-            except Exception:
-                return True  # If we can't read it, treat as binary
+        return True  # Already doesn't exist, so consider it a success
+    except Exception as e:
+        log.error(f"Failed to remove temporary directory {temp_dir}: {str(e)}")
+        return False
+
+
+def create_github_temp_dir(owner: str, repo_name: str) -> pathlib.Path:
+    """
+    Create a temporary directory specifically for GitHub repository operations.
+    
+    Args:
+        owner: Repository owner
+        repo_name: Repository name
         
-        # For non-existent files or paths without extensions, default to text
-        if ext == '' or ext in ('.txt', '.md', '.py', '.js', '.html', '.css', '.json'):
-            return False
-            
-        # Default for unknown types
-        return True
+    Returns:
+        Path: Path to the created temporary directory
+    """
+    prefix = f"github_repo_{owner}_{repo_name}_"
+    return create_temp_dir(prefix)
 
-    # YouTube-specific paths
-    @staticmethod
-    def youtube_data_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """
-        Get the YouTube data directory.
+
+def is_binary_file(file_path: str) -> bool:
+    """Check if a file is binary.
+    
+    Args:
+        file_path (str): Path to the file
         
-        Args:
-            base_dir: Base data directory. If None, uses the default from Config.
-            
-        Returns:
-            Path to the YouTube data directory
-        """
-        # Import here to avoid circular import
-        from oarc_crawlers.config.config import Config
+    Returns:
+        bool: True if file is binary, False otherwise
+    """
+    # Check extension first
+    _, ext = os.path.splitext(file_path.lower())
+    if ext in GITHUB_BINARY_EXTENSIONS:
+        return True
         
-        # Use Config.get_instance().data_dir if base_dir is not provided
-        if base_dir is None:
-            config = Config.get_instance()  # Get the singleton instance using get_instance()
-            base_dir = str(config.data_dir)
-            
-        return Paths.ensure_path(pathlib.Path(base_dir) / YOUTUBE_DATA_DIR)
+    # Check file contents if needed and the file exists
+    if os.path.exists(file_path):
+        try:
+            with open(file_path, 'rb') as f:
+                chunk = f.read(1024)
+                return b'\0' in chunk  # Binary files typically contain null bytes
+        except Exception:
+            return True  # If we can't read it, treat as binary
     
+    # For non-existent files or paths without extensions, default to text
+    if ext == '' or ext in ('.txt', '.md', '.py', '.js', '.html', '.css', '.json'):
+        return False
+        
+    # Default for unknown types
+    return True
 
-    @staticmethod
-    def youtube_videos_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube videos directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "videos")
-    
 
-    @staticmethod
-    def youtube_playlists_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube playlists directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "playlists")
+# YouTube-specific paths
+def youtube_data_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """
+    Get the YouTube data directory.
     
+    Args:
+        base_dir: Base data directory. If None, uses the default from Config.
+        
+    Returns:
+        Path to the YouTube data directory
+    """
+    return pathlib.Path(_ensure_dir(os.path.join(_base_or_default(base_dir), YOUTUBE_DATA_DIR)))
 
-    @staticmethod
-    def youtube_captions_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube captions directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "captions")
-    
 
-    @staticmethod
-    def youtube_search_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube search results directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "searches")
-    
+def youtube_videos_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube videos directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "videos")
 
-    @staticmethod
-    def youtube_chats_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube chat messages directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "chats")
-    
 
-    @staticmethod
-    def youtube_metadata_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
-        """Get the YouTube metadata directory."""
-        return Paths.ensure_path(Paths.youtube_data_dir(base_dir) / "metadata")
-    
+def youtube_playlists_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube playlists directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "playlists")
 
-    @staticmethod
-    def youtube_metadata_path(base_dir: Optional[PathLike] = None, video_id: str = None) -> pathlib.Path:
-        """
-        Get the path for YouTube video metadata.
-        
-        Args:
-            base_dir: Base data directory. If None, uses the default from Config.
-            video_id: YouTube video ID
-            
-        Returns:
-            Path to the metadata file
-        """
-        metadata_dir = Paths.youtube_metadata_dir(base_dir)
-        if video_id:
-            return metadata_dir / f"{video_id}.parquet"
-        return metadata_dir
+
+def youtube_captions_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube captions directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "captions")
+
+
+def youtube_search_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube search results directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "searches")
+
+
+def youtube_chats_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube chat messages directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "chats")
+
+
+def youtube_metadata_dir(base_dir: Optional[PathLike] = None) -> pathlib.Path:
+    """Get the YouTube metadata directory."""
+    return _ensured_youtube_subdir(_base_or_default(base_dir), "metadata")
+
+
+def youtube_metadata_path(base_dir: Optional[PathLike] = None, video_id: str = None) -> pathlib.Path:
+    """
+    Get the path for YouTube video metadata.
     
-    @staticmethod
-    def youtube_playlist_dir(output_path: PathLike, playlist_title: str, playlist_id: str) -> pathlib.Path:
-        """
-        Create a standardized directory path for a YouTube playlist.
+    Args:
+        base_dir: Base data directory. If None, uses the default from Config.
+        video_id: YouTube video ID
         
-        Args:
-            output_path: Base output directory
-            playlist_title: Title of the playlist
-            playlist_id: YouTube playlist ID
-            
-        Returns:
-            Path to the playlist directory
-        """
-        safe_title = Paths.sanitize_filename(playlist_title)
-        playlist_dir = pathlib.Path(output_path) / f"{safe_title}_{playlist_id}"
-        return Paths.ensure_path(playlist_dir)
-
-    # GitHub-specific paths
-    @staticmethod
-    def github_repos_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the GitHub repositories directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / GITHUB_REPOS_DIR)
-    
+    Returns:
+        Path to the metadata file
+    """
+    metadata_dir = youtube_metadata_dir(base_dir)
+    if video_id:
+        return pathlib.Path(os.path.join(metadata_dir, f"{video_id}.parquet"))
+    return metadata_dir
 
-    @staticmethod
-    def github_repo_dir(base_dir: PathLike, owner: str, repo: str) -> pathlib.Path:
-        """
-        Get the directory for a specific GitHub repository.
-        
-        Args:
-            base_dir: Base data directory
-            owner: Repository owner/user
-            repo: Repository name
-            
-        Returns:
-            Path to the repository directory
-        """
-        safe_owner = Paths.sanitize_filename(owner)
-        safe_repo = Paths.sanitize_filename(repo)
-        return Paths.github_repos_dir(base_dir) / f"{safe_owner}_{safe_repo}"
-    
 
-    @staticmethod
-    def github_repo_data_path(base_dir: PathLike, owner: str, repo: str) -> pathlib.Path:
-        """
-        Get the path for GitHub repository data.
-        
-        Args:
-            base_dir: Base data directory
-            owner: Repository owner/user
-            repo: Repository name
-            
-        Returns:
-            Path to the repository data file
-        """
-        safe_owner = Paths.sanitize_filename(owner)
-        safe_repo = Paths.sanitize_filename(repo)
-        return Paths.github_repos_dir(base_dir) / f"{safe_owner}_{safe_repo}.parquet"
+def youtube_playlist_dir(output_path: PathLike, playlist_title: str, playlist_id: str) -> pathlib.Path:
+    """
+    Create a standardized directory path for a YouTube playlist.
     
+    Args:
+        output_path: Base output directory
+        playlist_title: Title of the playlist
+        playlist_id: YouTube playlist ID
+        
+    Returns:
+        Path to the playlist directory
+    """
+    safe_title = sanitize_filename(playlist_title)
+    playlist_dir = os.path.join(os.fspath(output_path), f"{safe_title}_{playlist_id}")
+    return ensure_path(playlist_dir)
 
-    # Web crawler paths
-    @staticmethod
-    def web_crawls_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the web crawls directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / WEB_CRAWLS_DIR)
-    
 
-    @staticmethod
-    def web_crawl_data_path(base_dir: PathLike, domain: str) -> pathlib.Path:
-        """
-        Get a path for web crawl data.
-        
-        Args:
-            base_dir: Base data directory
-            domain: Domain name
-            
-        Returns:
-            Path to the crawl data file
-        """
-        safe_domain = Paths.sanitize_filename(domain)
-        return Paths.timestamped_path(Paths.web_crawls_dir(base_dir), safe_domain, "parquet")
-    
+# GitHub-specific paths
+def github_repos_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the GitHub repositories directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), GITHUB_REPOS_DIR))
 
-    # ArXiv paths
-    @staticmethod
-    def arxiv_papers_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the ArXiv papers directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / ARXIV_PAPERS_DIR)
-    
 
-    @staticmethod
-    def arxiv_sources_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the ArXiv sources directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / ARXIV_SOURCES_DIR)
+def github_repo_dir(base_dir: PathLike, owner: str, repo: str) -> pathlib.Path:
+    """
+    Get the directory for a specific GitHub repository.
     
+    Args:
+        base_dir: Base data directory
+        owner: Repository owner/user
+        repo: Repository name
+        
+    Returns:
+        Path to the repository directory
+    """
+    safe_owner = sanitize_filename(owner)
+    safe_repo = sanitize_filename(repo)
+    return pathlib.Path(os.path.join(github_repos_dir(base_dir), f"{safe_owner}_{safe_repo}"))
 
-    @staticmethod
-    def arxiv_combined_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the ArXiv combined data directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / ARXIV_COMBINED_DIR)
-    
 
-    @staticmethod
-    def arxiv_paper_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
-        """
-        Get the path for an ArXiv paper.
-        
-        Args:
-            base_dir: Base data directory
-            arxiv_id: ArXiv paper ID
-            
-        Returns:
-            Path to the paper file
-        """
-        safe_id = Paths.sanitize_filename(arxiv_id)
-        return Paths.arxiv_papers_dir(base_dir) / f"{safe_id}.parquet"
+def github_repo_data_path(base_dir: PathLike, owner: str, repo: str) -> pathlib.Path:
+    """
+    Get the path for GitHub repository data.
     
-
-    @staticmethod
-    def arxiv_keywords_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
-        """Get path for ArXiv paper keywords."""
-        safe_id = Paths.sanitize_filename(arxiv_id)
-        return Paths.arxiv_papers_dir(base_dir) / f"{safe_id}_keywords.parquet"
+    Args:
+        base_dir: Base data directory
+        owner: Repository owner/user
+        repo: Repository name
         
-    @staticmethod
-    def arxiv_references_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
-        """Get path for ArXiv paper references."""
-        safe_id = Paths.sanitize_filename(arxiv_id)
-        return Paths.arxiv_papers_dir(base_dir) / f"{safe_id}_references.parquet"
-        
-    @staticmethod
-    def arxiv_equations_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
-        """Get path for ArXiv paper equations."""
-        safe_id = Paths.sanitize_filename(arxiv_id)
-        return Paths.arxiv_papers_dir(base_dir) / f"{safe_id}_equations.parquet"
-        
-    @staticmethod
-    def arxiv_category_path(base_dir: PathLike, category: str) -> pathlib.Path:
-        """Get path for ArXiv category papers."""
-        safe_category = Paths.sanitize_filename(category)
-        timestamp = int(datetime.now().timestamp())
-        return Paths.arxiv_papers_dir(base_dir) / f"category_{safe_category}_{timestamp}.parquet"
-        
-    @staticmethod
-    def arxiv_network_path(base_dir: PathLike, timestamp: int) -> pathlib.Path:
-        """Get path for ArXiv citation network."""
-        return Paths.arxiv_papers_dir(base_dir) / f"citation_network_{timestamp}.parquet"
-    
+    Returns:
+        Path to the repository data file
+    """
+    safe_owner = sanitize_filename(owner)
+    safe_repo = sanitize_filename(repo)
+    return pathlib.Path(os.path.join(github_repos_dir(base_dir), f"{safe_owner}_{safe_repo}.parquet"))
+
+
+# Web crawler paths
+def web_crawls_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the web crawls directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), WEB_CRAWLS_DIR))
+
 
-    # DuckDuckGo paths
-    @staticmethod
-    def ddg_searches_dir(base_dir: PathLike) -> pathlib.Path:
-        """Get the DuckDuckGo searches directory."""
-        return Paths.ensure_path(pathlib.Path(base_dir) / DDG_SEARCHES_DIR)
+def web_crawl_data_path(base_dir: PathLike, domain: str) -> pathlib.Path:
+    """
+    Get a path for web crawl data.
     
+    Args:
+        base_dir: Base data directory
+        domain: Domain name
+        
+    Returns:
+        Path to the crawl data file
+    """
+    safe_domain = sanitize_filename(domain)
+    return timestamped_path(web_crawls_dir(base_dir), safe_domain, "parquet")
+
+
+# ArXiv paths
+def arxiv_papers_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the ArXiv papers directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), ARXIV_PAPERS_DIR))
+
+
+def arxiv_sources_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the ArXiv sources directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), ARXIV_SOURCES_DIR))
+
+
+def arxiv_combined_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the ArXiv combined data directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), ARXIV_COMBINED_DIR))
+
+
+def arxiv_paper_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
+    """
+    Get the path for an ArXiv paper.
     
-    @staticmethod
-    def ddg_search_data_path(base_dir: PathLike, query: str, search_type: str = "") -> pathlib.Path:
-        """
-        Get a path for DuckDuckGo search data.
+    Args:
+        base_dir: Base data directory
+        arxiv_id: ArXiv paper ID
         
-        Args:
-            base_dir: Base data directory
-            query: Search query
-            search_type: Type of search (e.g., "text", "image", "news")
-            
-        Returns:
-            Path to the search data file
-        """
-        safe_query = Paths.sanitize_filename(query)
-        prefix = f"{search_type}_" if search_type else ""
-        return Paths.timestamped_path(Paths.ddg_searches_dir(base_dir), f"{prefix}{safe_query}", "parquet")
+    Returns:
+        Path to the paper file
+    """
+    safe_id = sanitize_filename(arxiv_id)
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"{safe_id}.parquet"))
+
+
+def arxiv_keywords_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
+    """Get path for ArXiv paper keywords."""
+    safe_id = sanitize_filename(arxiv_id)
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"{safe_id}_keywords.parquet"))
+
+
+def arxiv_references_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
+    """Get path for ArXiv paper references."""
+    safe_id = sanitize_filename(arxiv_id)
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"{safe_id}_references.parquet"))
+
+
+def arxiv_equations_path(base_dir: PathLike, arxiv_id: str) -> pathlib.Path:
+    """Get path for ArXiv paper equations."""
+    safe_id = sanitize_filename(arxiv_id)
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"{safe_id}_equations.parquet"))
+
+
+def arxiv_category_path(base_dir: PathLike, category: str) -> pathlib.Path:
+    """Get path for ArXiv category papers."""
+    safe_category = sanitize_filename(category)
+    timestamp = time.time_ns() // 1_000_000_000
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"category_{safe_category}_{timestamp}.parquet"))
+
+
+def arxiv_network_path(base_dir: PathLike, timestamp: int) -> pathlib.Path:
+    """Get path for ArXiv citation network."""
+    return pathlib.Path(os.path.join(arxiv_papers_dir(base_dir), f"citation_network_{timestamp}.parquet"))
+
+
+# DuckDuckGo paths
+def ddg_searches_dir(base_dir: PathLike) -> pathlib.Path:
+    """Get the DuckDuckGo searches directory."""
+    return ensure_path(os.path.join(os.fspath(base_dir), DDG_SEARCHES_DIR))
+
+
+def ddg_search_data_path(base_dir: PathLike, query: str, search_type: str = "") -> pathlib.Path:
+    """
+    Get a path for DuckDuckGo search data.
     
+    Args:
+        base_dir: Base data directory
+        query: Search query
+        search_type: Type of search (e.g., "text", "image", "news")
+        
+    Returns:
+        Path to the search data file
+    """
+    safe_query = sanitize_filename(query)
+    prefix = f"{search_type}_" if search_type else ""
+    return timestamped_path(ddg_searches_dir(base_dir), f"{prefix}{safe_query}", "parquet")
+
+
+@functools.lru_cache(maxsize=None)
+def _fixed_config_locations() -> Tuple[str, str]:
+    return (
+        os.path.join(get_oarc_dir(), _OARC_CONFIG_SUFFIX),  # OARC config directory
+        os.path.join(os.path.expanduser("~"), DEFAULT_CONFIG_FILENAME),  # User home directory
+    )
+
+
+def get_default_config_locations() -> Tuple[str, ...]:
+    """Get the default locations where config files might exist, as path strings."""
+    return (
+        os.path.join(os.getcwd(), DEFAULT_CONFIG_FILENAME),  # Current directory
+        *_fixed_config_locations(),
+    )
+
+
+def find_config_file() -> Optional[pathlib.Path]:
+    """
+    Find a config file in the default locations.
+
+    The result, including "not found", is cached until
+    invalidate_config_cache() is called.
+    """
+    global _config_path_cache
+    if _config_path_cache is _MISSING:
+        _config_path_cache = next(
+            (pathlib.Path(path) for path in get_default_config_locations() if os.path.isfile(path)),
+            None,
+        )
+    return _config_path_cache
+
+
+def invalidate_config_cache() -> None:
+    """Forget the cached config file location, e.g. after writing a config file."""
+    global _config_path_cache
+    _config_path_cache = _MISSING
+
+
+def ensure_config_dir() -> pathlib.Path:
+    """Ensure the config directory exists and return it."""
+    config_dir = get_oarc_dir() / CONFIG_DIR
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
+class Paths:
+    """
+    Namespace over the module-level path helpers, kept so existing
+    ``Paths.<helper>(...)`` call sites keep working.
+    """
 
-    @staticmethod
-    def get_default_config_locations() -> List[pathlib.Path]:
-        """Get the default locations where config files might exist."""
-        return [
-            pathlib.Path.cwd() / DEFAULT_CONFIG_FILENAME,  # Current directory
-            Paths.get_oarc_dir() / CONFIG_DIR / DEFAULT_CONFIG_FILENAME,  # OARC config directory
-            pathlib.Path.home() / DEFAULT_CONFIG_FILENAME,  # User home directory
-        ]
-
-
-    @staticmethod
-    def find_config_file() -> Optional[pathlib.Path]:
-        """Find a config file in the default locations."""
-        for path in Paths.get_default_config_locations():
-            if path.exists():
-                return path
-        return None
-
-
-    @staticmethod
-    def ensure_config_dir() -> pathlib.Path:
-        """Ensure the config directory exists and return it."""
-        config_dir = Paths.get_oarc_dir() / CONFIG_DIR
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir
+    ensure_path = staticmethod(ensure_path)
+    ensure_path_leaf = staticmethod(ensure_path_leaf)
+    get_oarc_home_dir = staticmethod(get_oarc_home_dir)
+    get_oarc_dir = staticmethod(get_oarc_dir)
+    get_default_data_dir = staticmethod(get_default_data_dir)
+    reset_ensured_cache = staticmethod(reset_ensured_cache)
+    clear_caches = staticmethod(clear_caches)
+    invalidate_default_base = staticmethod(invalidate_default_base)
+    get_temp_dir = staticmethod(get_temp_dir)
+    sanitize_filename = staticmethod(sanitize_filename)
+    timestamped_path = staticmethod(timestamped_path)
+    is_valid_path = staticmethod(is_valid_path)
+    ensure_parent_dir = staticmethod(ensure_parent_dir)
+    file_exists = staticmethod(file_exists)
+    create_temp_dir = staticmethod(create_temp_dir)
+    ensure_temp_dir = staticmethod(ensure_temp_dir)
+    cleanup_temp_dir = staticmethod(cleanup_temp_dir)
+    create_github_temp_dir = staticmethod(create_github_temp_dir)
+    is_binary_file = staticmethod(is_binary_file)
+    youtube_data_dir = staticmethod(youtube_data_dir)
+    youtube_videos_dir = staticmethod(youtube_videos_dir)
+    youtube_playlists_dir = staticmethod(youtube_playlists_dir)
+    youtube_captions_dir = staticmethod(youtube_captions_dir)
+    youtube_search_dir = staticmethod(youtube_search_dir)
+    youtube_chats_dir = staticmethod(youtube_chats_dir)
+    youtube_metadata_dir = staticmethod(youtube_metadata_dir)
+    youtube_metadata_path = staticmethod(youtube_metadata_path)
+    youtube_playlist_dir = staticmethod(youtube_playlist_dir)
+    github_repos_dir = staticmethod(github_repos_dir)
+    github_repo_dir = staticmethod(github_repo_dir)
+    github_repo_data_path = staticmethod(github_repo_data_path)
+    web_crawls_dir = staticmethod(web_crawls_dir)
+    web_crawl_data_path = staticmethod(web_crawl_data_path)
+    arxiv_papers_dir = staticmethod(arxiv_papers_dir)
+    arxiv_sources_dir = staticmethod(arxiv_sources_dir)
+    arxiv_combined_dir = staticmethod(arxiv_combined_dir)
+    arxiv_paper_path = staticmethod(arxiv_paper_path)
+    arxiv_keywords_path = staticmethod(arxiv_keywords_path)
+    arxiv_references_path = staticmethod(arxiv_references_path)
+    arxiv_equations_path = staticmethod(arxiv_equations_path)
+    arxiv_category_path = staticmethod(arxiv_category_path)
+    arxiv_network_path = staticmethod(arxiv_network_path)
+    ddg_searches_dir = staticmethod(ddg_searches_dir)
+    ddg_search_data_path = staticmethod(ddg_search_data_path)
+    get_default_config_locations = staticmethod(get_default_config_locations)
+    find_config_file = staticmethod(find_config_file)
+    invalidate_config_cache = staticmethod(invalidate_config_cache)
+    ensure_config_dir = staticmethod(ensure_config_dir)
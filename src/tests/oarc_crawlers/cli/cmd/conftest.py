@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from unittest.mock import patch, AsyncMock
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared Click test runner; tests only call ``invoke`` on it."""
+    return CliRunner()
+
+
+@pytest.fixture
+def crawler_error():
+    """Context manager patching a crawler class so one of its methods fails.
+
+    By default the method raises ``Exception("fail")``; pass AsyncMock keyword
+    arguments (e.g. ``return_value={"error": "fail"}``) to fail differently.
+    """
+    @contextmanager
+    def _ctx(crawler_path, method, **mock_kwargs):
+        mock_kwargs = mock_kwargs or {"side_effect": Exception("fail")}
+        with patch(crawler_path) as mock_crawler:
+            setattr(mock_crawler.return_value, method, AsyncMock(**mock_kwargs))
+            yield mock_crawler
+    return _ctx
@@ -1,13 +1,8 @@
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, AsyncMock, MagicMock
 
 import oarc_crawlers.cli.cmd.arxiv_cmd as arxiv_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 @pytest.fixture(autouse=True)
 def patch_arxiv_crawler():
     with patch("oarc_crawlers.cli.cmd.arxiv_cmd.ArxivCrawler") as mock_crawler:
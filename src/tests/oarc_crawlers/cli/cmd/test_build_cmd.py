@@ -1,13 +1,7 @@
-import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
 import oarc_crawlers.cli.cmd.build_cmd as build_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 def test_build_group_help(runner):
     result = runner.invoke(build_cmd.build, ["--help"])
     assert result.exit_code == 0
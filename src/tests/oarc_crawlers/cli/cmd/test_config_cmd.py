@@ -1,13 +1,7 @@
-import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
 import oarc_crawlers.cli.cmd.config_cmd as config_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 def test_config_group_help(runner):
     result = runner.invoke(config_cmd.config, ["--help"])
     assert result.exit_code == 0
@@ -1,15 +1,9 @@
-import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import os
 
 from oarc_crawlers.cli.cmd.data_cmd import data
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 def test_data_group_help(runner):
     result = runner.invoke(data, ["--help"])
     assert result.exit_code == 0
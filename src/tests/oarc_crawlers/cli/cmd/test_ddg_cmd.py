@@ -1,13 +1,8 @@
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, AsyncMock
 
 import oarc_crawlers.cli.cmd.ddg_cmd as ddg_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 @pytest.fixture(autouse=True)
 def patch_ddg_crawler():
     with patch("oarc_crawlers.cli.cmd.ddg_cmd.DDGCrawler") as mock_crawler:
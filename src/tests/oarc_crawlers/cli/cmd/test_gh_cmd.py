@@ -1,13 +1,8 @@
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, AsyncMock
 
 import oarc_crawlers.cli.cmd.gh_cmd as gh_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
 @pytest.fixture(autouse=True)
 def patch_gh_crawler():
     with patch("oarc_crawlers.cli.cmd.gh_cmd.GHCrawler") as mock_crawler:
@@ -1,13 +1,39 @@
+import json
+
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
 import oarc_crawlers.cli.cmd.mcp_cmd as mcp_cmd
 from oarc_crawlers.utils.const import SUCCESS, ERROR
 
+_BASE_SERVER = {
+    'pid': 12345,
+    'port': 3000,
+    'status': 'running',
+    'uptime_sec': 3600,
+    'memory_mb': 50.5,
+    'cpu_percent': 2.5,
+    'connections': 3
+}
+
+@pytest.fixture
+def fake_server():
+    """A fresh copy of a running server entry; tests may update it freely."""
+    return _BASE_SERVER.copy()
+
 @pytest.fixture
-def runner():
-    return CliRunner()
+def no_exit():
+    """Stub out sys.exit, which ``mcp stop`` calls directly.
+
+    Not autouse: the run/install error tests depend on the real exit path.
+    """
+    with patch("sys.exit"):
+        yield
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_format_uptime():
+    with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.format_uptime", return_value="1h 0m 0s"):
+        yield
 
 def test_mcp_group_help(runner):
     result = runner.invoke(mcp_cmd.mcp, ["--help"])
@@ -40,19 +66,15 @@ def test_mcp_install_error(runner):
         result = runner.invoke(mcp_cmd.mcp, ["install"])
         assert result.exit_code != 0
 
-def test_mcp_stop_all_success(runner):
+def test_mcp_stop_all_success(runner, no_exit):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.stop_all_mcp_servers", return_value=(2, 0)):
-        # Mock sys.exit to prevent the test from exiting
-        with patch("sys.exit"):
-            result = runner.invoke(mcp_cmd.mcp, ["stop", "--all"])
-            assert "Successfully stopped 2 MCP server(s)" in result.output
+        result = runner.invoke(mcp_cmd.mcp, ["stop", "--all"])
+        assert "Successfully stopped 2 MCP server(s)" in result.output
 
-def test_mcp_stop_port_success(runner):
+def test_mcp_stop_port_success(runner, no_exit):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.stop_mcp_server_on_port", return_value=True):
-        # Mock sys.exit to prevent the test from exiting
-        with patch("sys.exit"):
-            result = runner.invoke(mcp_cmd.mcp, ["stop", "--port", "5000"])
-            assert "MCP server on port 5000 stopped successfully" in result.output
+        result = runner.invoke(mcp_cmd.mcp, ["stop", "--port", "5000"])
+        assert "MCP server on port 5000 stopped successfully" in result.output
 
 def test_mcp_list_no_servers(runner):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.list_mcp_servers", return_value=[]):
@@ -60,74 +82,43 @@ def test_mcp_list_no_servers(runner):
         assert "No MCP servers currently running" in result.output
         assert result.exit_code == SUCCESS
 
-def test_mcp_list_with_servers(runner):
-    fake_server = {
-        'pid': 12345,
-        'port': 3000,
-        'status': 'running',
-        'uptime_sec': 3600,
-        'memory_mb': 50.5,
-        'cpu_percent': 2.5,
-        'connections': 3
-    }
+def test_mcp_list_with_servers(runner, fake_server):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.list_mcp_servers", return_value=[fake_server]):
-        with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.format_uptime", return_value="1h 0m 0s"):
-            result = runner.invoke(mcp_cmd.mcp, ["list"])
-            assert "Found 1 running MCP server(s)" in result.output
-            assert "12345" in result.output
-            assert "3000" in result.output
-            assert "running" in result.output
-            assert "50.5 MB" in result.output
-            assert result.exit_code == SUCCESS
-
-def test_mcp_list_with_none_values(runner):
+        result = runner.invoke(mcp_cmd.mcp, ["list"])
+        assert "Found 1 running MCP server(s)" in result.output
+        assert "12345" in result.output
+        assert "3000" in result.output
+        assert "running" in result.output
+        assert "50.5 MB" in result.output
+        assert result.exit_code == SUCCESS
+
+def test_mcp_list_with_none_values(runner, fake_server):
     # Test with None values that previously caused the TypeError
-    fake_server = {
-        'pid': 12345,
+    fake_server.update({
         'port': None,  # This was causing the error
-        'status': 'running',
-        'uptime_sec': 3600,
         'memory_mb': None,  # Also test None for memory
-        'cpu_percent': None,
-        'connections': 3
-    }
+        'cpu_percent': None
+    })
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.list_mcp_servers", return_value=[fake_server]):
-        with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.format_uptime", return_value="1h 0m 0s"):
-            result = runner.invoke(mcp_cmd.mcp, ["list"])
-            assert "Found 1 running MCP server(s)" in result.output
-            assert "12345" in result.output
-            assert "N/A" in result.output  # Check that None values are displayed as N/A
-            assert result.exit_code == SUCCESS
-
-def test_mcp_list_json_format(runner):
-    fake_server = {
-        'pid': 12345,
-        'port': 3000,
-        'status': 'running',
-        'uptime_sec': 3600,
-        'memory_mb': 50.5
-    }
+        result = runner.invoke(mcp_cmd.mcp, ["list"])
+        assert "Found 1 running MCP server(s)" in result.output
+        assert "12345" in result.output
+        assert "N/A" in result.output  # Check that None values are displayed as N/A
+        assert result.exit_code == SUCCESS
+
+def test_mcp_list_json_format(runner, fake_server):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.list_mcp_servers", return_value=[fake_server]):
         result = runner.invoke(mcp_cmd.mcp, ["list", "--format", "json"])
-        assert '"pid": 12345' in result.output
-        assert '"port": 3000' in result.output
+        payload = json.loads(result.output)
+        assert payload[0]["pid"] == 12345
+        assert payload[0]["port"] == 3000
         assert result.exit_code == SUCCESS
 
-def test_mcp_list_verbose(runner):
-    fake_server = {
-        'pid': 12345,
-        'port': 3000,
-        'status': 'running',
-        'uptime_sec': 3600,
-        'memory_mb': 50.5,
-        'cpu_percent': 2.5,
-        'connections': 3
-    }
+def test_mcp_list_verbose(runner, fake_server):
     with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.list_mcp_servers", return_value=[fake_server]):
-        with patch("oarc_crawlers.utils.mcp_utils.MCPUtils.format_uptime", return_value="1h 0m 0s"):
-            result = runner.invoke(mcp_cmd.mcp, ["list", "--verbose"])
-            assert "CPU" in result.output
-            assert "Connections" in result.output
-            assert "2.5%" in result.output
-            assert "3" in result.output
-            assert result.exit_code == SUCCESS
+        result = runner.invoke(mcp_cmd.mcp, ["list", "--verbose"])
+        assert "CPU" in result.output
+        assert "Connections" in result.output
+        assert "2.5%" in result.output
+        assert "3" in result.output
+        assert result.exit_code == SUCCESS
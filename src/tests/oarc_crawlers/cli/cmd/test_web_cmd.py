@@ -1,14 +1,9 @@
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, AsyncMock
 
 import oarc_crawlers.cli.cmd.web_cmd as web_cmd
 
-@pytest.fixture
-def runner():
-    return CliRunner()
-
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def patch_web_crawler():
     with patch("oarc_crawlers.cli.cmd.web_cmd.WebCrawler") as mock_crawler:
         instance = mock_crawler.return_value
@@ -28,32 +23,21 @@ def test_web_group_help(runner):
     assert result.exit_code == 0
     assert "web" in result.output
 
-@pytest.mark.parametrize("subcmd,opts", [
-    ("crawl", ["--url", "https://example.com"]),
-    ("docs", ["--url", "https://docs.python.org"]),
-    ("pypi", ["--package", "requests"]),
+@pytest.mark.parametrize("argv", [
+    ["crawl", "--url", "https://example.com"],
+    ["docs", "--url", "https://docs.python.org"],
+    ["pypi", "--package", "requests"],
 ])
-def test_web_subcommands_run(runner, subcmd, opts):
-    result = runner.invoke(web_cmd.web, [subcmd] + opts)
+def test_web_subcommands_run(runner, argv):
+    result = runner.invoke(web_cmd.web, argv)
     assert result.exit_code == 0
 
-def test_web_crawl_error(runner):
-    with patch("oarc_crawlers.cli.cmd.web_cmd.WebCrawler") as mock_crawler:
-        instance = mock_crawler.return_value
-        instance.fetch_url_content = AsyncMock(side_effect=Exception("fail"))
-        result = runner.invoke(web_cmd.web, ["crawl", "--url", "bad"])
-        assert result.exit_code != 0
-
-def test_web_docs_error(runner):
-    with patch("oarc_crawlers.cli.cmd.web_cmd.WebCrawler") as mock_crawler:
-        instance = mock_crawler.return_value
-        instance.crawl_documentation_site = AsyncMock(side_effect=Exception("fail"))
-        result = runner.invoke(web_cmd.web, ["docs", "--url", "bad"])
-        assert result.exit_code != 0
-
-def test_web_pypi_error(runner):
-    with patch("oarc_crawlers.cli.cmd.web_cmd.WebCrawler") as mock_crawler:
-        instance = mock_crawler.return_value
-        instance.fetch_pypi_info = AsyncMock(side_effect=Exception("fail"))
-        result = runner.invoke(web_cmd.web, ["pypi", "--package", "bad"])
+@pytest.mark.parametrize("subcmd,method,opts", [
+    ("crawl", "fetch_url_content", ["--url", "bad"]),
+    ("docs", "crawl_documentation_site", ["--url", "bad"]),
+    ("pypi", "fetch_pypi_info", ["--package", "bad"]),
+])
+def test_web_error(runner, crawler_error, subcmd, method, opts):
+    with crawler_error("oarc_crawlers.cli.cmd.web_cmd.WebCrawler", method):
+        result = runner.invoke(web_cmd.web, [subcmd] + opts)
         assert result.exit_code != 0
@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import MagicMock
+
+import questionary
+
+from oarc_crawlers.config.config_editor import ConfigEditor
+from oarc_crawlers.config.config_manager import ConfigManager
+
+
+def _answer(value):
+    question = MagicMock(spec=questionary.Question)
+    question.ask.return_value = value
+    return question
+
+
+@pytest.fixture(scope="module")
+def confirm_no():
+    """Prebuilt questionary prompt whose ``ask()`` answers False."""
+    return _answer(False)
+
+
+@pytest.fixture(scope="module")
+def confirm_yes():
+    """Prebuilt questionary prompt whose ``ask()`` answers True."""
+    return _answer(True)
+
+
+@pytest.fixture(scope="session")
+def config_manager():
+    """The ConfigManager singleton, created once for the whole session."""
+    return ConfigManager()
+
+
+@pytest.fixture(scope="session")
+def config_editor():
+    """The ConfigEditor singleton, created once for the whole session."""
+    return ConfigEditor()
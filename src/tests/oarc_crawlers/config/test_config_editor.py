@@ -3,25 +3,29 @@ from unittest.mock import patch, MagicMock
 
 from oarc_crawlers.config.config_editor import ConfigEditor
 
-def test_config_editor_is_singleton():
-    e1 = ConfigEditor()
-    e2 = ConfigEditor()
-    assert e1 is e2
+@pytest.fixture
+def fake_editor_state(monkeypatch):
+    """Set the editor's current config and field details in one call."""
+    def _apply(current, details):
+        monkeypatch.setattr(ConfigEditor, "_current_config", current)
+        monkeypatch.setattr(ConfigEditor, "_config_details", details)
+    return _apply
 
-def test_config_editor_ensure_initialized():
+def test_config_editor_is_singleton(config_editor):
+    assert config_editor is ConfigEditor()
+
+def test_config_editor_ensure_initialized(config_editor):
     # Should not raise
-    ConfigEditor._ensure_initialized()
+    config_editor._ensure_initialized()
 
-def test_config_editor_is_config_changed_false(monkeypatch):
-    monkeypatch.setattr(ConfigEditor, "_current_config", {"foo": "bar"})
-    monkeypatch.setattr(ConfigEditor, "_config_details", {"foo": {"description": ""}})
+def test_config_editor_is_config_changed_false(fake_editor_state):
+    fake_editor_state({"foo": "bar"}, {"foo": {"description": ""}})
     with patch("oarc_crawlers.config.config_editor.Config", MagicMock(return_value=MagicMock(get=lambda k: "bar"))):
         assert ConfigEditor.is_config_changed() is False
 
-def test_config_editor_reset_to_defaults(monkeypatch):
+def test_config_editor_reset_to_defaults(fake_editor_state):
     # Simulate a config with two keys to ensure reset works for all keys
-    monkeypatch.setattr(ConfigEditor, "_current_config", {"foo": "bar", "baz": "qux"})
-    monkeypatch.setattr(ConfigEditor, "_config_details", {"foo": {"description": ""}, "baz": {"description": ""}})
+    fake_editor_state({"foo": "bar", "baz": "qux"}, {"foo": {"description": ""}, "baz": {"description": ""}})
     class DummyConfig:
         DEFAULTS = {"foo": "baz", "baz": "reset"}
     with patch("oarc_crawlers.config.config_editor.Config", DummyConfig):
@@ -29,14 +33,14 @@ def test_config_editor_reset_to_defaults(monkeypatch):
         assert ConfigEditor._current_config["foo"] == "baz"
         assert ConfigEditor._current_config["baz"] == "reset"
 
-def test_config_editor_save_changes(monkeypatch, tmp_path):
+def test_config_editor_save_changes(monkeypatch, tmp_path, confirm_no):
     config_file = tmp_path / "test.ini"
     monkeypatch.setattr("oarc_crawlers.config.config_manager.ConfigManager.find_config_file", lambda: config_file)
     monkeypatch.setattr("oarc_crawlers.utils.paths.Paths.ensure_config_dir", lambda: tmp_path)
     edited = {"foo": "bar"}
-    with patch("oarc_crawlers.config.config_editor.questionary.confirm", MagicMock(return_value=MagicMock(ask=lambda: False))):
+    with patch("oarc_crawlers.config.config_editor.questionary.confirm", return_value=confirm_no):
         assert ConfigEditor.save_changes(edited) is True
 
-def test_config_editor_confirm_reset():
-    with patch("oarc_crawlers.config.config_editor.questionary.confirm", MagicMock(return_value=MagicMock(ask=lambda: True))):
+def test_config_editor_confirm_reset(confirm_yes):
+    with patch("oarc_crawlers.config.config_editor.questionary.confirm", return_value=confirm_yes):
         assert ConfigEditor.confirm_reset() is True
@@ -3,13 +3,11 @@ from unittest.mock import patch, MagicMock
 
 from oarc_crawlers.config.config_manager import ConfigManager
 
-def test_config_manager_is_singleton():
-    c1 = ConfigManager()
-    c2 = ConfigManager()
-    assert c1 is c2
+def test_config_manager_is_singleton(config_manager):
+    assert config_manager is ConfigManager()
 
-def test_get_config_details():
-    details = ConfigManager.get_config_details()
+def test_get_config_details(config_manager):
+    details = config_manager.get_config_details()
     assert isinstance(details, dict)
     assert "data_dir" in details
 
@@ -1,34 +1,33 @@
+from contextlib import nullcontext
+
 from oarc_crawlers.config.config_validators import NumberValidator, PathValidator
 import pytest
 from prompt_toolkit.document import Document
 from prompt_toolkit.validation import ValidationError
 
-def test_number_validator_valid():
-    validator = NumberValidator()
-    doc = Document("5")
-    # Should not raise
-    validator.validate(doc, min_val=1, max_val=10)
-
-def test_number_validator_invalid():
-    validator = NumberValidator()
-    doc = Document("abc")
-    with pytest.raises(ValidationError):
-        validator.validate(doc, min_val=1, max_val=10)
+@pytest.fixture(scope="module")
+def number_validator():
+    return NumberValidator()
 
-def test_number_validator_out_of_range():
-    validator = NumberValidator()
-    doc = Document("0")
-    with pytest.raises(ValidationError):
-        validator.validate(doc, min_val=1, max_val=10)
+@pytest.fixture(scope="module")
+def path_validator():
+    return PathValidator()
 
-def test_path_validator_valid():
-    validator = PathValidator()
-    doc = Document("some/path")
-    # Should not raise
-    validator.validate(doc)
+@pytest.mark.parametrize("text,min_val,max_val,raises", [
+    ("5", 1, 10, False),
+    ("abc", 1, 10, True),   # not a number
+    ("0", 1, 10, True),     # out of range
+])
+def test_number_validator(number_validator, text, min_val, max_val, raises):
+    expectation = pytest.raises(ValidationError) if raises else nullcontext()
+    with expectation:
+        number_validator.validate(Document(text), min_val=min_val, max_val=max_val)
 
-def test_path_validator_empty():
-    validator = PathValidator()
-    doc = Document("")
-    with pytest.raises(ValidationError):
-        validator.validate(doc)
+@pytest.mark.parametrize("text,raises", [
+    ("some/path", False),
+    ("", True),
+])
+def test_path_validator(path_validator, text, raises):
+    expectation = pytest.raises(ValidationError) if raises else nullcontext()
+    with expectation:
+        path_validator.validate(Document(text))
@@ -0,0 +1,2 @@
+# crawlerTestUI.py is a standalone PyQt6 demo, not a test module
+collect_ignore = ["crawlerTestUI.py"]
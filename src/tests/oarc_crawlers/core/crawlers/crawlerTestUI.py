@@ -7,23 +7,27 @@ This script provides visualization for:
 """
 
 import asyncio
+import importlib
+from collections import Counter
 from pathlib import Path
 import sys
+import threading
+import time
 from typing import List, Optional, Union
 import json
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                             QWidget, QLineEdit, QSpinBox, QLabel, QTextEdit, QFrame, QHBoxLayout,
                             QRadioButton, QButtonGroup, QCheckBox)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
-from pyvis.network import Network
+from PyQt6.QtCore import QObject, pyqtSignal, Qt, QUrl
 
 from oarc_crawlers import ArxivCrawler, OEISCrawler
-from PyQt6.QtWebEngineWidgets import QWebEngineView  # Add this import
-from PyQt6.QtCore import QUrl
+from oarc_crawlers.utils.paths import Paths
 
 import os
-from PyQt6 import QtWebEngineWidgets
+
+# PyQt6 WebEngine and pyvis are imported where they are used, so importing
+# this module (e.g. during test collection) only loads the core Qt widgets.
 
 # Modern dark theme styles
 STYLE_SHEET = """
@@ -74,6 +78,251 @@ QLabel {
 }
 """
 
+# Neon node colors by citation depth; deeper nodes reuse the last one
+_DEPTH_COLORS = ('#ff7a93', '#7aa2f7', '#9ece6a', '#e0af68', '#bb9af7')
+_MAX_COLOR = len(_DEPTH_COLORS) - 1
+
+# Node tooltip HTML, assembled per node with str.join
+_TOOLTIP_PREFIX = ("<div style='background-color: #24283b; padding: 10px; "
+                   "border-radius: 8px; border: 2px solid #414868;'>")
+_PAPER_TITLE_PREFIX = (_TOOLTIP_PREFIX + "<strong style='color: #7aa2f7;'>Title:</strong> "
+                       "<span style='color: #a9b1d6;'>")
+_AUTHORS_MID = ("</span><br><strong style='color: #7aa2f7;'>Authors:</strong>"
+                "<span style='color: #a9b1d6;'>")
+_SEQUENCE_TITLE_PREFIX = (_TOOLTIP_PREFIX + "<strong style='color: #7aa2f7;'>Sequence:</strong> "
+                          "<span style='color: #a9b1d6;'>")
+_TERMS_MID = ("</span><br><strong style='color: #7aa2f7;'>First Terms:</strong> "
+              "<span style='color: #a9b1d6;'>")
+_TOOLTIP_SUFFIX = "</span></div>"
+
+# Above this many nodes the page is rendered with Cytoscape.js instead of vis.js
+_CYTOSCAPE_MIN_NODES = 2000
+_CYTOSCAPE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="https://unpkg.com/cytoscape@3.30.2/dist/cytoscape.min.js"></script>
+<script src="https://unpkg.com/layout-base@1.0.2/layout-base.js"></script>
+<script src="https://unpkg.com/cose-base@1.0.3/cose-base.js"></script>
+<script src="https://unpkg.com/cytoscape-cose-bilkent@4.1.0/cytoscape-cose-bilkent.js"></script>
+<style>
+html, body, #cy { width: 100%; height: 100%; margin: 0; background-color: #1a1b26; }
+#tooltip { position: absolute; display: none; pointer-events: none; z-index: 10;
+           max-width: 400px; white-space: pre-line; color: #a9b1d6; }
+</style>
+</head>
+<body>
+<div id="cy"></div>
+<div id="tooltip"></div>
+<script>
+var cy = cytoscape({
+    container: document.getElementById('cy'),
+    elements: __ELEMENTS__,
+    style: [
+        {selector: 'node', style: {
+            'background-color': 'data(color)', 'label': 'data(label)',
+            'width': 'data(size)', 'height': 'data(size)',
+            'color': '#a9b1d6', 'font-size': 12}},
+        {selector: 'edge', style: {
+            'line-color': 'data(color)', 'target-arrow-color': 'data(color)',
+            'target-arrow-shape': 'triangle', 'curve-style': 'haystack', 'width': 1}}
+    ],
+    layout: __LAYOUT__
+});
+var tooltip = document.getElementById('tooltip');
+cy.on('mouseover', 'node', function (evt) {
+    var pos = evt.target.renderedPosition();
+    tooltip.innerHTML = evt.target.data('title');
+    tooltip.style.left = (pos.x + 15) + 'px';
+    tooltip.style.top = (pos.y + 15) + 'px';
+    tooltip.style.display = 'block';
+});
+cy.on('mouseout', 'node', function () { tooltip.style.display = 'none'; });
+</script>
+</body>
+</html>
+"""
+
+# Page-side layouts: computed in the page, or positions supplied by Python
+_CYTOSCAPE_COSE_LAYOUT = "{name: 'cose-bilkent', animate: false}"
+_CYTOSCAPE_PRESET_LAYOUT = "{name: 'preset'}"
+
+
+def _render_cytoscape(nodes: list, edges: list) -> str:
+    """Build a Cytoscape.js page from the node and edge payloads built for PyVis.
+
+    Nodes that all carry x/y (from the worker's networkx layout) are placed
+    as-is with the preset layout; otherwise cose-bilkent lays the graph out in
+    the page.
+    Node tooltips are shown on hover, as vis.js does.
+    """
+    elements = [
+        {'data': {'id': node['id'], 'label': node['label'], 'title': node['title'],
+                  'color': node['color'], 'size': node['size']}}
+        for node in nodes
+    ]
+    if all('x' in node for node in nodes):
+        for element, node in zip(elements, nodes, strict=True):
+            element['position'] = {'x': node['x'], 'y': node['y']}
+        layout = _CYTOSCAPE_PRESET_LAYOUT
+    else:
+        layout = _CYTOSCAPE_COSE_LAYOUT
+    elements.extend(
+        {'data': {'source': edge['from'], 'target': edge['to'],
+                  'color': edge['color']['color']}}
+        for edge in edges
+    )
+    # Keep "</script>" inside string values from closing the script block
+    payload = json.dumps(elements).replace("</", "<\\/")
+    return _CYTOSCAPE_TEMPLATE.replace("__LAYOUT__", layout).replace("__ELEMENTS__", payload)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a uvloop (or winloop on Windows) loop if installed, else asyncio's own."""
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        loop_module = importlib.import_module(module_name)
+    except ImportError:
+        return asyncio.new_event_loop()
+    return loop_module.new_event_loop()
+
+
+def _load_orjson_dumps():
+    """Return a tojson-compatible orjson serializer, or None if orjson is missing."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def dumps(obj, **kwargs):
+        # Jinja passes sort_keys; key order does not matter for the vis.js data
+        return orjson.dumps(obj).decode()
+    return dumps
+
+_orjson_dumps = _load_orjson_dumps()
+
+_template_env = None
+
+
+def _shared_template_env(net):
+    """Return the Jinja environment shared by every PyVis render.
+
+    Each Network builds its own environment, so its template would be read
+    and compiled on every render; keeping the first one lets Jinja's template
+    cache serve the rest. The node/edge payload goes through Jinja's tojson
+    filter, which uses orjson here when it is available.
+    """
+    global _template_env
+    if _template_env is None:
+        _template_env = net.templateEnv
+        if _orjson_dumps is not None:
+            _template_env.policies["json.dumps_function"] = _orjson_dumps
+    return _template_env
+
+# Once physics settles, the page reports node positions through its title,
+# which the window watches (no QWebChannel needed for a one-way message)
+_LAYOUT_TITLE_PREFIX = "layout:"
+_CAPTURE_LAYOUT_JS = f"""
+if (typeof network !== 'undefined') {{
+    network.once('stabilized', function () {{
+        document.title = '{_LAYOUT_TITLE_PREFIX}' + JSON.stringify(network.getPositions());
+    }});
+}}
+"""
+
+# vis.js options for every PyVis render, assigned as a dict so PyVis does not
+# have to parse a JS options string each time
+_NETWORK_OPTIONS = {
+    "nodes": {
+        "shadow": True,
+        "borderWidth": 3,
+        "borderWidthSelected": 4,
+        "font": {"size": 14, "color": "#a9b1d6"},
+        "scaling": {"min": 20, "max": 60},
+        "widthConstraint": {"minimum": 100}
+    },
+    "edges": {
+        "smooth": {"type": "continuous"},
+        "shadow": True,
+        "selectionWidth": 4
+    },
+    "physics": {
+        "barnesHut": {
+            "gravitationalConstant": -2000,
+            "springLength": 200,
+            "springConstant": 0.05,
+            "damping": 0.09,
+            "avoidOverlap": 0.5
+        },
+        "minVelocity": 0.75
+    },
+    "interaction": {
+        "hover": True,
+        "navigationButtons": True,
+        "multiselect": True,
+        "dragNodes": True,
+        "zoomView": True,
+        # Skip redrawing edges while the view moves
+        "hideEdgesOnDrag": True,
+        "hideEdgesOnZoom": True
+    }
+}
+
+# Above this many edges, edges are drawn straight...
+_STRAIGHT_EDGES_MIN = 500
+# ...and above this many, shadows (an extra draw pass per frame) are dropped
+_NO_SHADOW_MIN_EDGES = 2000
+
+# Edge styling shared by every edge of a kind; serialized, never mutated
+_INTERNAL_EDGE_COLOR = {'color': '#7aa2f7', 'highlight': '#89b4fa'}
+_EXTERNAL_EDGE_COLOR = {'color': '#414868', 'highlight': '#89b4fa'}
+_EDGE_ARROWS = {'to': {'enabled': True, 'scaleFactor': 0.5}}
+
+# Above this many nodes the layout switches from Barnes-Hut to ForceAtlas2
+_FORCE_ATLAS_MIN_NODES = 200
+_FORCE_ATLAS_SETTINGS = {
+    "gravitationalConstant": -50,
+    "centralGravity": 0.01,
+    "springLength": 100,
+    "springConstant": 0.08,
+    "damping": 0.4,
+    "avoidOverlap": 0
+}
+# ...and stops the simulation sooner, so Run Layout does not keep the page busy
+_FORCE_ATLAS_MIN_VELOCITY = 1.5
+
+# Larger graphs render with physics off so they paint at once
+_PHYSICS_OFF_MIN_NODES = 200
+_RUN_LAYOUT_JS = "network.setOptions({physics: {enabled: true}});"
+_NO_IMPROVED_LAYOUT = {"improvedLayout": False}
+# networkx's spring layout is quadratic per iteration; past this many nodes
+# the layout is left to the browser (cose-bilkent in Cytoscape)
+_SPRING_LAYOUT_MAX_NODES = 5000
+
+# Above this many nodes, tooltips stay out of the vis.js DataSet and are
+# attached to a node the first time it is hovered
+_LAZY_TOOLTIP_MIN_NODES = 500
+_LAZY_TOOLTIP_SCRIPT = """<script>
+var TOOLTIPS = __TOOLTIPS__;
+network.on('hoverNode', function (params) {
+    if (params.node in TOOLTIPS) {
+        nodes.update({id: params.node, title: TOOLTIPS[params.node]});
+        delete TOOLTIPS[params.node];
+    }
+});
+</script>
+"""
+
+# QWebEngineView.setHtml() cannot display content of 2 MB or more
+_SET_HTML_LIMIT = 2 * 1024 * 1024
+_HTML_BASE_URL = QUrl("https://cdnjs.cloudflare.com/")
+
+# Generated networks are cached on disk under data_dir for this long
+_DISK_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Worker progress messages are coalesced and sent at most this often
+_PROGRESS_FLUSH_SECONDS = 0.1
+
 class CardFrame(QFrame):
     """Custom card-style frame with modern styling."""
     def __init__(self, parent=None):
@@ -89,39 +338,93 @@ class CardFrame(QFrame):
             }
         """)
 
-class NetworkWorker(QThread):
-    """Worker thread for network generation."""
-    finished = pyqtSignal(dict)
+class NetworkWorker(QObject):
+    """Runs network generation on one background asyncio loop.
+
+    The loop and its thread live as long as the window, so repeated
+    generations reuse them (and the ArxivCrawler) instead of starting fresh.
+    Results are handed back to the GUI thread through Qt signals, together
+    with any layout precomputed here; progress messages are batched so a deep
+    crawl doesn't flood the Qt event queue.
+    """
+    finished = pyqtSignal(dict, dict)
     error = pyqtSignal(str)
-    progress = pyqtSignal(str)
+    progress = pyqtSignal(list)
 
-    def __init__(self, input_str: str, data_dir: str, max_depth: int, mode: str = 'arxiv'):
+    def __init__(self, data_dir: str, paper_cache: Optional[dict] = None,
+                 network_cache: Optional[dict] = None):
         super().__init__()
-        self.input_str = input_str
         self.data_dir = data_dir
-        self.max_depth = max_depth
-        self.mode = mode
+        self.paper_cache = paper_cache
+        self.network_cache = network_cache
+        self.arxiv = ArxivCrawler(data_dir=data_dir)
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self.loop = _new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name="network-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, input_str: str, max_depth: int, mode: str = 'arxiv',
+               refresh: bool = False):
+        """Schedule a generation on the worker loop; returns immediately."""
+        if mode == 'arxiv':
+            coro = process_arxiv_input(
+                input_str,
+                self.data_dir,
+                max_depth,
+                progress_callback=self._queue_progress,
+                paper_cache=self.paper_cache,
+                network_cache=self.network_cache,
+                arxiv=self.arxiv,
+                refresh=refresh
+            )
+        else:  # OEIS mode
+            coro = process_oeis_input(
+                input_str,
+                self.data_dir,
+                max_depth,
+                progress_callback=self._queue_progress,
+                refresh=refresh
+            )
+        future = asyncio.run_coroutine_threadsafe(self._generate(coro), self.loop)
+        future.add_done_callback(self._on_done)
+
+    async def _generate(self, coro):
+        """Await a generation, then lay the network out off the GUI thread."""
+        network = await coro
+        positions = await asyncio.to_thread(_spring_positions, network)
+        return network, positions
+
+    def _queue_progress(self, message: str):
+        """Buffer a progress message; the first one arms a flush 100 ms out."""
+        with self._pending_lock:
+            self._pending.append(message)
+            first = len(self._pending) == 1
+        if first:
+            self.loop.call_soon_threadsafe(
+                self.loop.call_later, _PROGRESS_FLUSH_SECONDS, self._flush_progress)
 
-    def run(self):
+    def _flush_progress(self):
+        """Emit everything buffered so far as a single batch."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self.progress.emit(batch)
+
+    def _on_done(self, future):
+        self._flush_progress()
         try:
-            if self.mode == 'arxiv':
-                network = asyncio.run(process_arxiv_input(
-                    self.input_str,
-                    self.data_dir,
-                    self.max_depth,
-                    progress_callback=self.progress.emit
-                ))
-            else:  # OEIS mode
-                network = asyncio.run(process_oeis_input(
-                    self.input_str,
-                    self.data_dir,
-                    self.max_depth,
-                    progress_callback=self.progress.emit
-                ))
-            self.finished.emit(network)
+            self.finished.emit(*future.result())
         except Exception as e:
             self.error.emit(str(e))
 
+    def stop(self):
+        """Stop the loop, wait for its thread and close it."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
 class CitationNetworkUI(QMainWindow):
     """Main window for the citation network visualization tool."""
     
@@ -198,11 +501,15 @@ class CitationNetworkUI(QMainWindow):
         
         self.show_authors = QCheckBox("Show Author Nodes")
         self.show_external = QCheckBox("Show External References")
+        # Skip the cached network and layout and crawl again
+        self.refresh_cache = QCheckBox("Refetch (ignore cache)")
         self.show_authors.setChecked(False)
         self.show_external.setChecked(True)
+        self.refresh_cache.setChecked(False)
         
         options_layout.addWidget(self.show_authors)
         options_layout.addWidget(self.show_external)
+        options_layout.addWidget(self.refresh_cache)
         left_layout.addWidget(options_card)
 
         # Update input placeholder based on mode
@@ -239,24 +546,63 @@ class CitationNetworkUI(QMainWindow):
         self.save_button.setEnabled(False)
         button_layout.addWidget(self.save_button)
         
+        # Save the raw network data; far smaller than the HTML page
+        self.save_data_button = QPushButton("Save Data (JSON)")
+        self.save_data_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.save_data_button.clicked.connect(self.save_network_data)
+        self.save_data_button.setMinimumHeight(50)
+        self.save_data_button.setEnabled(False)
+        button_layout.addWidget(self.save_data_button)
+        
+        # Layout button (large graphs load with physics off)
+        self.layout_button = QPushButton("Run Layout")
+        self.layout_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.layout_button.clicked.connect(self.run_layout)
+        self.layout_button.setMinimumHeight(50)
+        self.layout_button.setEnabled(False)
+        button_layout.addWidget(self.layout_button)
+        
         left_layout.addLayout(button_layout)
         left_layout.addStretch()
         
         # Add left panel to main layout
         horizontal_layout.addWidget(left_panel, stretch=40)
         
-        # Add web view for visualization
-        self.web_view = QWebEngineView()
-        self.web_view.setMinimumWidth(600)
-        horizontal_layout.addWidget(self.web_view, stretch=60)
+        # Reserve room for the web view; Chromium only starts once there is
+        # a network to show (see _ensure_web_view)
+        self._horizontal_layout = horizontal_layout
+        self._view_placeholder = QWidget()
+        self._view_placeholder.setMinimumWidth(600)
+        horizontal_layout.addWidget(self._view_placeholder, stretch=60)
+        self.web_view = None
         
         # Set up data directory
         self.data_dir = Path("./arxiv_data")
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self.worker = None
         self.current_network = None
+        # Reused across clicks: paper info by ArXiv ID, networks by (ID, depth)
+        self._paper_cache: dict[str, dict] = {}
+        self._network_cache: dict[tuple, dict] = {}
         self.current_visualization = None
+        # Where the settled layout of the current seed/depth is cached
+        self._layout_path: Optional[Path] = None
+
+        # One long-lived worker; only one generation runs at a time since
+        # the button is disabled meanwhile
+        self.worker = NetworkWorker(
+            str(self.data_dir),
+            paper_cache=self._paper_cache,
+            network_cache=self._network_cache
+        )
+        self.worker.finished.connect(self.on_network_generated)
+        self.worker.error.connect(self.on_error)
+        self.worker.progress.connect(self.log_batch)
+
+    def closeEvent(self, event):
+        """Shut down the worker loop with the window."""
+        self.worker.stop()
+        super().closeEvent(event)
 
     def update_input_placeholder(self):
         if self.arxiv_radio.isChecked():
@@ -265,40 +611,77 @@ class CitationNetworkUI(QMainWindow):
             self.arxiv_input.setPlaceholderText("Enter OEIS ID (e.g., A000045)")
 
     def generate_network(self):
-        """Start network generation in a separate thread."""
+        """Start network generation on the worker loop."""
         self.generate_button.setEnabled(False)
         self.status_display.clear()
         self.log_status("Starting network generation...")
         
-        # Create and start worker thread
-        self.worker = NetworkWorker(
-            self.arxiv_input.text(),
-            str(self.data_dir),
-            self.depth_selector.value(),
-            'arxiv' if self.arxiv_radio.isChecked() else 'oeis'
-        )
-        self.worker.finished.connect(self.on_network_generated)
-        self.worker.error.connect(self.on_error)
-        self.worker.progress.connect(self.log_status)
-        self.worker.start()
+        input_str = self.arxiv_input.text()
+        depth = self.depth_selector.value()
+        mode = 'arxiv' if self.arxiv_radio.isChecked() else 'oeis'
+        layout_name = Paths.sanitize_filename(f"{mode}_{input_str}_{depth}")
+        self._layout_path = self.data_dir / f"{layout_name}.layout.json"
+        refresh = self.refresh_cache.isChecked()
+        if refresh:
+            # The refetched network may differ from the one this layout was settled for
+            self._layout_path.unlink(missing_ok=True)
+        
+        self.worker.submit(input_str, depth, mode, refresh)
 
-    def on_network_generated(self, network: dict):
-        """Handle the generated network."""
+    def on_network_generated(self, network: dict, positions: dict):
+        """Handle the generated network and its precomputed layout, if any."""
         self.generate_button.setEnabled(True)
         self.log_status("Network generated successfully!")
+        self.current_network = network
+        self.save_data_button.setEnabled(True)
         
         # Create visualization
-        self.create_network_visualization(network)
+        self.create_network_visualization(network, positions)
 
     def on_error(self, error_msg: str):
         """Handle any errors during network generation."""
         self.generate_button.setEnabled(True)
         self.log_status(f"Error: {error_msg}")
 
+    def run_layout(self):
+        """Turn physics on in the displayed network."""
+        self.web_view.page().runJavaScript(_RUN_LAYOUT_JS)
+        self.layout_button.setEnabled(False)
+
+    def _load_layout(self) -> dict:
+        """Return cached node positions for the current seed/depth, if any."""
+        if self._layout_path is None or not self._layout_path.is_file():
+            return {}
+        try:
+            with open(self._layout_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _watch_layout(self, ok: bool):
+        """Ask a freshly loaded page to report its positions once settled."""
+        if ok:
+            self.web_view.page().runJavaScript(_CAPTURE_LAYOUT_JS)
+
+    def _store_layout(self, title: str):
+        """Persist the positions the page reported through its title."""
+        if not title.startswith(_LAYOUT_TITLE_PREFIX) or self._layout_path is None:
+            return
+        try:
+            with open(self._layout_path, 'w', encoding='utf-8') as f:
+                f.write(title[len(_LAYOUT_TITLE_PREFIX):])
+            self.log_status(f"Cached layout to {self._layout_path}")
+        except OSError as e:
+            self.log_status(f"Warning: Could not cache layout: {str(e)}")
+
     def log_status(self, message: str):
         """Add a message to the status display."""
         self.status_display.append(message)
 
+    def log_batch(self, messages: list):
+        """Add a batch of worker messages with a single append."""
+        self.status_display.append("\n".join(messages))
+
     def save_network(self):
         """Save the current network visualization."""
         if not self.current_visualization:
@@ -320,8 +703,36 @@ class CitationNetworkUI(QMainWindow):
         except Exception as e:
             self.log_status(f"Error saving visualization: {str(e)}")
 
-    def create_network_visualization(self, network: dict):
-        """Create an interactive network visualization using PyVis."""
+    def save_network_data(self):
+        """Save the current network's nodes and edges as compact JSON."""
+        if not self.current_network:
+            self.log_status("No network to save!")
+            return
+        
+        try:
+            save_path = Path(self.save_location.text() or "citation_network").with_suffix('.json')
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            data = {'nodes': self.current_network['nodes'], 'edges': self.current_network['edges']}
+            if _orjson_dumps is not None:
+                payload = _orjson_dumps(data)
+            else:
+                payload = json.dumps(data, separators=(',', ':'), default=str)
+            with open(save_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            
+            self.log_status(f"✨ Network data saved to: {save_path}")
+        except Exception as e:
+            self.log_status(f"Error saving network data: {str(e)}")
+
+    def create_network_visualization(self, network: dict, precomputed: Optional[dict] = None):
+        """Create an interactive network visualization using PyVis.
+
+        ``precomputed`` holds node positions laid out by the worker (see
+        _spring_positions); they are used when no cached layout covers the graph.
+        """
+        from pyvis.network import Network
+
         # Create network with dark theme
         net = Network(
             height="100%",
@@ -329,162 +740,212 @@ class CitationNetworkUI(QMainWindow):
             bgcolor="#1a1b26",
             font_color="#a9b1d6",
             notebook=False,
-            cdn_resources="in_line"  # Add this line to include dependencies
+            # Load vis.js from cdnjs instead of inlining ~700 KB into every
+            # page; keeps far more graphs under the setHtml() size limit
+            cdn_resources="remote"
         )
+        # Reuse one template environment so PyVis's template is compiled once
+        net.templateEnv = _shared_template_env(net)
         
-        # Configure physics
-        net.barnes_hut(
-            gravity=-2000,
-            central_gravity=0.3,
-            spring_length=200,
-            spring_strength=0.05,
-            damping=0.09,
-            overlap=0
-        )
-        
-        # Track nodes
-        valid_nodes = set()
-        external_nodes = set()
-        
-        # First add all internal nodes
-        for node_id, node_data in network['nodes'].items():
-            try:
-                # Different visualization for ArXiv vs OEIS
-                if self.arxiv_radio.isChecked():
-                    title = f"""
-                    <div style='background-color: #24283b; padding: 10px; border-radius: 8px; border: 2px solid #414868;'>
-                        <strong style='color: #7aa2f7;'>Title:</strong> 
-                        <span style='color: #a9b1d6;'>{node_data['title']}</span>
-                        {f"<br><strong style='color: #7aa2f7;'>Authors:</strong><span style='color: #a9b1d6;'>{', '.join(node_data['authors'])}</span>" if self.show_authors.isChecked() else ""}
-                    </div>
-                    """
-                else:
-                    title = f"""
-                    <div style='background-color: #24283b; padding: 10px; border-radius: 8px; border: 2px solid #414868;'>
-                        <strong style='color: #7aa2f7;'>Sequence:</strong> 
-                        <span style='color: #a9b1d6;'>{node_data['title']}</span><br>
-                        <strong style='color: #7aa2f7;'>First Terms:</strong> 
-                        <span style='color: #a9b1d6;'>{node_data.get('terms', '[...]')}</span>
-                    </div>
-                    """
-                
-                net.add_node(
-                    node_id,
-                    label=f"{node_id}",
-                    title=title,
-                    color=self.get_node_color(node_data['depth']),
-                    size=40 if node_data['depth'] == 0 else 25,  # Made nodes bigger
-                    borderWidth=3,
-                    borderWidthSelected=4,
-                    font={'size': 14, 'color': '#a9b1d6'},
-                    shape='dot'
-                )
-                valid_nodes.add(node_id)
-            except Exception as e:
-                self.log_status(f"Warning: Could not add node {node_id}: {str(e)}")
+        # Node tooltips; the mode and author toggles are read once, not per node
+        if self.arxiv_radio.isChecked():
+            if self.show_authors.isChecked():
+                titles = [
+                    "".join((_PAPER_TITLE_PREFIX, node_data['title'], _AUTHORS_MID,
+                             ", ".join(node_data['authors']), _TOOLTIP_SUFFIX))
+                    for node_data in network['nodes'].values()
+                ]
+            else:
+                titles = [
+                    "".join((_PAPER_TITLE_PREFIX, node_data['title'], _TOOLTIP_SUFFIX))
+                    for node_data in network['nodes'].values()
+                ]
+        else:
+            titles = [
+                "".join((_SEQUENCE_TITLE_PREFIX, node_data['title'], _TERMS_MID,
+                         str(node_data.get('terms', '[...]')), _TOOLTIP_SUFFIX))
+                for node_data in network['nodes'].values()
+            ]
+
+        # Build the node and edge payloads PyVis would create and hand them over
+        # in one go; add_node/add_edge repeat membership checks on every call.
+        # Border and font styling for internal nodes comes from the "nodes"
+        # defaults in _NETWORK_OPTIONS.
+        nodes = [
+            {
+                'id': node_id,
+                'label': str(node_id),
+                'title': title,
+                'color': _DEPTH_COLORS[min(node_data['depth'], _MAX_COLOR)],
+                'size': 40 if node_data['depth'] == 0 else 25,  # Made nodes bigger
+                'shape': 'dot'
+            }
+            for (node_id, node_data), title in zip(network['nodes'].items(), titles, strict=True)
+        ]
+        valid_nodes = frozenset(network['nodes'])
 
         # Only add external nodes if option is enabled
+        external_nodes = frozenset()
         if self.show_external.isChecked():
             # Count citations to each external paper
-            external_citation_counts = {}
-            for edge in network['edges']:
-                if edge['target'] not in valid_nodes:
-                    external_citation_counts[edge['target']] = external_citation_counts.get(edge['target'], 0) + 1
+            external_citation_counts = Counter(
+                edge['target'] for edge in network['edges'] if edge['target'] not in valid_nodes
+            )
 
             # Add external nodes (only if they have citations)
-            for target, citation_count in external_citation_counts.items():
-                try:
-                    net.add_node(
-                        target,
-                        label=target,
-                        title=f"External Citation: {target}\nCited {citation_count} times",
-                        color='#414868',
-                        size=15 + min(citation_count * 2, 20),  # Size based on citations
-                        shape='diamond',
-                        borderWidth=1,
-                        font={'size': 12, 'color': '#565f89'}
-                    )
-                    external_nodes.add(target)
-                    self.log_status(f"Added external citation node: {target} (cited {citation_count} times)")
-                except Exception as e:
-                    self.log_status(f"Warning: Could not add external node {target}: {str(e)}")
-
-        # Add edges
+            nodes.extend(
+                {
+                    'id': target,
+                    'label': target,
+                    'title': f"External Citation: {target}\nCited {citation_count} times",
+                    'color': '#414868',
+                    'size': 15 + min(citation_count * 2, 20),  # Size based on citations
+                    'shape': 'diamond',
+                    'borderWidth': 1,
+                    'font': {'size': 12, 'color': '#565f89'}
+                }
+                for target, citation_count in external_citation_counts.items()
+            )
+            external_nodes = frozenset(external_citation_counts)
+            if external_nodes:
+                self.log_status(f"Added {len(external_nodes)} external citation node(s)")
+
+        # Mirror citations produce repeated (source, target) pairs; draw each
+        # pair once and let repeats thicken the arrow instead
+        dedup = {}
         for edge in network['edges']:
-            try:
-                source, target = edge['source'], edge['target']
-                if source in valid_nodes and (target in valid_nodes or target in external_nodes):
-                    net.add_edge(
-                        source,
-                        target,
-                        title=edge.get('citation', ''),
-                        color={'color': '#7aa2f7' if target in valid_nodes else '#414868', 
-                              'highlight': '#89b4fa'},
-                        arrows={'to': {'enabled': True, 'scaleFactor': 0.5}},
-                        width=2 if target in valid_nodes else 1
-                    )
-            except Exception as e:
-                self.log_status(f"Warning: Could not add edge {source} → {target}: {str(e)}")
-
-        # Add custom CSS and options
-        net.set_options("""
-        var options = {
-            "nodes": {
-                "shadow": true,
-                "scaling": {"min": 20, "max": 60},
-                "widthConstraint": {"minimum": 100}
-            },
-            "edges": {
-                "smooth": {"type": "cubicBezier", "roundness": 0.5},
-                "shadow": true,
-                "selectionWidth": 4
-            },
-            "physics": {
-                "barnesHut": {
-                    "gravitationalConstant": -2000,
-                    "springLength": 200,
-                    "springConstant": 0.05,
-                    "damping": 0.09,
-                    "avoidOverlap": 0.5
-                },
-                "minVelocity": 0.75
-            },
-            "interaction": {
-                "hover": true,
-                "navigationButtons": true,
-                "multiselect": true,
-                "dragNodes": true,
-                "zoomView": true
-            }
-        }
-        """)
+            key = (edge['source'], edge['target'])
+            if key in dedup:
+                dedup[key][1] += 1
+            else:
+                dedup[key] = [edge.get('citation', ''), 1]
+
+        edges = []
+        for (source, target), (citation, weight) in dedup.items():
+            if source not in valid_nodes:
+                continue
+            if target in valid_nodes:
+                color, width = _INTERNAL_EDGE_COLOR, 2
+            elif target in external_nodes:
+                color, width = _EXTERNAL_EDGE_COLOR, 1
+            else:
+                continue
+            edges.append({
+                'from': source,
+                'to': target,
+                'title': citation,
+                'color': color,
+                'arrows': _EDGE_ARROWS,
+                'width': width + min(weight - 1, 3)
+            })
+
+        # Place nodes where a previous render of this seed/depth settled
+        positions = self._load_layout()
+        for node in nodes:
+            pos = positions.get(node['id'])
+            if pos:
+                node['x'], node['y'] = pos['x'], pos['y']
+        # Only a complete layout can skip physics; toggling external nodes
+        # may add nodes the cached layout never saw
+        fully_placed = bool(positions) and all('x' in node for node in nodes)
+
+        if not fully_placed and precomputed and len(nodes) > _PHYSICS_OFF_MIN_NODES:
+            # Large graphs use the worker's layout rather than the page's JS
+            # loop; this also gives Cytoscape preset positions below
+            for node in nodes:
+                node['x'], node['y'] = precomputed[node['id']]
+            fully_placed = True
+            self.log_status("Precomputed layout with networkx")
+
+        if len(nodes) > _CYTOSCAPE_MIN_NODES:
+            # vis.js canvas rendering bogs down past a few thousand nodes
+            self.layout_button.setEnabled(False)
+            self.log_status(f"Large network ({len(nodes)} nodes): rendering with Cytoscape.js")
+            self._show_visualization(_render_cytoscape(nodes, edges))
+            return
+
+        tooltips = None
+        if len(nodes) > _LAZY_TOOLTIP_MIN_NODES:
+            tooltips = {node['id']: node.pop('title') for node in nodes}
+
+        net.nodes = nodes
+        net.node_ids = [node['id'] for node in nodes]
+        net.node_map = {node['id']: node for node in nodes}
+        net.edges = edges
+
+        # Options are constant apart from the physics block (and, for large or
+        # dense graphs, the layout, edges and nodes blocks) tuned below, so only
+        # those are copied
+        net.options = {**_NETWORK_OPTIONS, 'physics': dict(_NETWORK_OPTIONS['physics'])}
+        # Barnes-Hut suits small graphs; ForceAtlas2 settles large ones faster.
+        # Cap stabilization work by graph size either way.
+        physics = net.options['physics']
+        if len(nodes) > _FORCE_ATLAS_MIN_NODES:
+            physics.pop('barnesHut', None)
+            physics['solver'] = 'forceAtlas2Based'
+            physics['forceAtlas2Based'] = _FORCE_ATLAS_SETTINGS
+            physics['minVelocity'] = _FORCE_ATLAS_MIN_VELOCITY
+        physics['stabilization'] = {"enabled": True, "iterations": min(1000, len(nodes) * 3)}
+        if len(nodes) > _PHYSICS_OFF_MIN_NODES:
+            # Skip vis.js's Kamada-Kawai seeding of unplaced nodes, which
+            # stalls the page on large graphs
+            net.options['layout'] = _NO_IMPROVED_LAYOUT
+        if len(edges) > _STRAIGHT_EDGES_MIN:
+            net.options['edges'] = {**_NETWORK_OPTIONS['edges'], 'smooth': False}
+        if len(edges) > _NO_SHADOW_MIN_EDGES:
+            net.options['nodes'] = {**_NETWORK_OPTIONS['nodes'], 'shadow': False}
+            net.options['edges']['shadow'] = False
+
+        if fully_placed:
+            # Cached or precomputed positions are already settled, so skip
+            # the physics run
+            physics['enabled'] = False
+            self.log_status("Nodes already placed; physics disabled")
+        elif len(nodes) > _PHYSICS_OFF_MIN_NODES:
+            # Paint large graphs immediately and let the user start the layout
+            physics['enabled'] = False
+            self.log_status("Large network: physics off, press Run Layout to arrange it")
+        self.layout_button.setEnabled(not physics.get('enabled', True))
         
+        # generate_html() already links vis.js and its CSS, so the page is
+        # used as-is rather than wrapped in another copy
+        html = net.generate_html()
+        if tooltips is not None:
+            payload = (_orjson_dumps or json.dumps)(tooltips).replace("</", "<\\/")
+            script = _LAZY_TOOLTIP_SCRIPT.replace("__TOOLTIPS__", payload)
+            end = html.rfind("</body>")
+            html = html[:end] + script + html[end:]
+        self._show_visualization(html)
+
+    def _ensure_web_view(self):
+        """Swap the placeholder for a QWebEngineView on first use."""
+        if self.web_view is not None:
+            return self.web_view
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        self.web_view = QWebEngineView()
+        self.web_view.setMinimumWidth(600)
+        self.web_view.loadFinished.connect(self._watch_layout)
+        self.web_view.titleChanged.connect(self._store_layout)
+        self._horizontal_layout.replaceWidget(self._view_placeholder, self.web_view)
+        self._view_placeholder.deleteLater()
+        self._view_placeholder = None
+        return self.web_view
+
+    def _show_visualization(self, html: str):
+        """Display a generated page and keep it for saving."""
         try:
-            # Generate HTML with custom template that includes vis.js
-            html_template = """
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <script type="text/javascript" src="https://cdnjs.cloudflare.com/ajax/libs/vis/4.21.0/vis.min.js"></script>
-                <link href="https://cdnjs.cloudflare.com/ajax/libs/vis/4.21.0/vis.min.css" rel="stylesheet" type="text/css">
-            </head>
-            <body>
-                {network_html}
-            </body>
-            </html>
-            """
+            self.current_visualization = html
+            self._ensure_web_view()
             
-            self.current_visualization = html_template.format(
-                network_html=net.generate_html().replace('<html>', '').replace('</html>', '')
-            )
-            
-            # Create a temporary file for the visualization
-            temp_path = Path("temp_visualization.html")
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(self.current_visualization)
-                
-            # Load in web view
-            self.web_view.setUrl(QUrl.fromLocalFile(str(temp_path.absolute())))
+            # Hand the page straight to the web view; setHtml() goes through a
+            # data: URL, so only pages over its size limit go via a temp file
+            if len(self.current_visualization.encode('utf-8')) < _SET_HTML_LIMIT:
+                self.web_view.setHtml(self.current_visualization, _HTML_BASE_URL)
+            else:
+                temp_path = Path("temp_visualization.html")
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(self.current_visualization)
+                self.web_view.setUrl(QUrl.fromLocalFile(str(temp_path.absolute())))
             
             # Enable save button
             self.save_button.setEnabled(True)
@@ -494,15 +955,64 @@ class CitationNetworkUI(QMainWindow):
             self.log_status(f"Error creating visualization: {str(e)}")
             raise
 
-    @staticmethod
-    def get_node_color(depth: int) -> str:
-        """Get color for node based on depth with neon theme."""
-        colors = ['#ff7a93', '#7aa2f7', '#9ece6a', '#e0af68', '#bb9af7']
-        return colors[min(depth, len(colors) - 1)]
+def _intern_ids(network: dict):
+    """Intern node and edge IDs in place.
+
+    Each ID recurs as a node key and as edge endpoints; interning makes the
+    repeated set/dict lookups during rendering hit identical objects.
+    """
+    network['nodes'] = {sys.intern(node_id): data for node_id, data in network['nodes'].items()}
+    for edge in network['edges']:
+        edge['source'] = sys.intern(edge['source'])
+        edge['target'] = sys.intern(edge['target'])
+
+def _spring_positions(network: dict) -> dict:
+    """Return ``{node_id: (x, y)}`` for a large network from a networkx spring layout.
+
+    Runs on the worker (via asyncio.to_thread), so the window stays responsive.
+    Papers and every cited target are placed, so the positions cover the graph
+    with or without external nodes shown. Returns an empty dict for graphs the
+    page lays out itself, or when networkx (or scipy, which it needs for graphs
+    over 500 nodes) is unavailable, leaving the layout to the browser.
+    """
+    node_ids = dict.fromkeys(network['nodes'])
+    node_ids.update(dict.fromkeys(edge['target'] for edge in network['edges']))
+    if not _PHYSICS_OFF_MIN_NODES < len(node_ids) <= _SPRING_LAYOUT_MAX_NODES:
+        return {}
+    try:
+        import networkx as nx
+        graph = nx.Graph()
+        graph.add_nodes_from(node_ids)
+        graph.add_edges_from((edge['source'], edge['target']) for edge in network['edges'])
+        pos = nx.spring_layout(graph, seed=42, iterations=50, scale=1000)
+    except ImportError:
+        return {}
+    return {node_id: (float(x), float(y)) for node_id, (x, y) in pos.items()}
+
+def _read_cache(path: Path) -> Optional[dict]:
+    """Return the JSON cached at ``path`` unless it is missing, stale or unreadable."""
+    try:
+        if time.time() - path.stat().st_mtime > _DISK_CACHE_MAX_AGE:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(path: Path, data: dict):
+    """Cache ``data`` as JSON at ``path``; failures only cost a refetch later."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=str)
+    except (OSError, TypeError, ValueError):
+        path.unlink(missing_ok=True)
 
 async def process_arxiv_input(input_str: str, data_dir: str = "./data", 
                             max_depth: int = 1, verbose: bool = False,
-                            progress_callback=None):
+                            progress_callback=None, paper_cache: Optional[dict] = None,
+                            network_cache: Optional[dict] = None,
+                            arxiv: Optional[ArxivCrawler] = None,
+                            refresh: bool = False):
     """
     Process ArXiv paper input (URL or ID) and crawl its citation network.
     
@@ -512,6 +1022,10 @@ async def process_arxiv_input(input_str: str, data_dir: str = "./data",
         max_depth: Maximum depth for citation crawling
         verbose: Whether to print detailed progress
         progress_callback: Optional callback for progress updates
+        paper_cache: Optional dict of paper info keyed by ArXiv ID, reused across calls
+        network_cache: Optional dict of networks keyed by (ArXiv ID, max_depth)
+        arxiv: Optional crawler to reuse; a new one is created if omitted
+        refresh: Crawl again even if the network is cached in memory or on disk
         
     Example inputs:
         - "1706.03762"
@@ -519,7 +1033,8 @@ async def process_arxiv_input(input_str: str, data_dir: str = "./data",
         - "https://arxiv.org/pdf/1706.03762.pdf"
     """
     # Initialize crawler with specified data directory
-    arxiv = ArxivCrawler(data_dir=data_dir)
+    if arxiv is None:
+        arxiv = ArxivCrawler(data_dir=data_dir)
     
     # Create data directory if it doesn't exist
     Path(data_dir).mkdir(parents=True, exist_ok=True)
@@ -537,17 +1052,45 @@ async def process_arxiv_input(input_str: str, data_dir: str = "./data",
     update_progress(f"Starting crawl with max depth {max_depth}")
     
     # First get the paper info to verify it exists
-    paper_info = await arxiv.fetch_paper_info(arxiv_id)
-    if 'error' in paper_info:
-        raise ValueError(f"Could not fetch paper: {paper_info['error']}")
+    if paper_cache is not None and arxiv_id in paper_cache:
+        paper_info = paper_cache[arxiv_id]
+    else:
+        paper_info = await arxiv.fetch_paper_info(arxiv_id)
+        if 'error' in paper_info:
+            raise ValueError(f"Could not fetch paper: {paper_info['error']}")
+        if paper_cache is not None:
+            paper_cache[arxiv_id] = paper_info
     
     update_progress(f"Initial paper: {paper_info['title']}")
     
     # Generate citation network
-    network = await arxiv.generate_citation_network(
-        seed_papers=[arxiv_id],
-        max_depth=max_depth
-    )
+    network_key = (arxiv_id, max_depth)
+    cache_path = Path(data_dir) / f"{Paths.sanitize_filename(f'arxiv_{arxiv_id}_d{max_depth}')}.json"
+    if not refresh and network_cache is not None and network_key in network_cache:
+        network = network_cache[network_key]
+        update_progress("Reusing previously generated network")
+    else:
+        network = None if refresh else _read_cache(cache_path)
+        complete = True
+        if network is not None:
+            update_progress(f"Loaded cached network from {cache_path}")
+        else:
+            network = await arxiv.generate_citation_network(
+                seed_papers=[arxiv_id],
+                max_depth=max_depth
+            )
+            # Papers dropped by failed (e.g. rate-limited) fetches leave the
+            # network partial; only a complete crawl is worth replaying
+            failed_count = network.get('stats', {}).get('failed_count', 0)
+            complete = failed_count == 0
+            if complete:
+                _write_cache(cache_path, network)
+            else:
+                update_progress(f"Warning: {failed_count} paper(s) could not be fetched; "
+                                "network not cached")
+        _intern_ids(network)
+        if network_cache is not None and complete:
+            network_cache[network_key] = network
     
     # Print statistics
     node_count = len(network.get('nodes', {}))
@@ -558,7 +1101,7 @@ async def process_arxiv_input(input_str: str, data_dir: str = "./data",
 
 async def process_oeis_input(input_str: str, data_dir: str = "./data",
                            max_depth: int = 1, verbose: bool = False,
-                           progress_callback=None):
+                           progress_callback=None, refresh: bool = False):
     """Process OEIS sequence input and build relationship network."""
     
     # Initialize OEIS crawler
@@ -574,55 +1117,69 @@ async def process_oeis_input(input_str: str, data_dir: str = "./data",
     sequence_id = input_str.strip().lstrip('A')
     update_progress(f"Processing OEIS sequence A{sequence_id}")
     
-    try:
-        # First get the sequence info
-        sequence_data = await oeis.fetch_sequence(sequence_id)
-        if not sequence_data or not sequence_data.get('values'):
-            raise ValueError(f"Could not fetch sequence A{sequence_id} or sequence has no values")
-        
-        update_progress(f"Found sequence: {sequence_data['title']}")
-        update_progress(f"First values: {', '.join(map(str, sequence_data['values'][:5]))}")
-        
-        # Build sequence network
-        network = await oeis.build_ontology([sequence_id])
-        
-        # Ensure proper node structure with required values
-        nodes = {}
-        for node_id, data in network.get('nodes', {}).items():
-            values = data.get('values', [])
-            title = data.get('title', '')
-            if values and title:  # Only add nodes with valid data
-                nodes[node_id] = {
-                    'title': title,
-                    'terms': values[:5],  # Only take first 5 values
-                    'depth': 0 if node_id == sequence_id else 1  # Set depth explicitly
+    cache_path = Path(data_dir) / f"{Paths.sanitize_filename(f'oeis_{sequence_id}_d{max_depth}')}.json"
+    vis_network = None if refresh else _read_cache(cache_path)
+    if vis_network is not None:
+        update_progress(f"Loaded cached network from {cache_path}")
+        return vis_network
+    
+    # One pooled HTTP session for every OEIS request in this build
+    async with oeis:
+        try:
+            # First get the sequence info
+            sequence_data = await oeis.fetch_sequence(sequence_id)
+            if not sequence_data or not sequence_data.get('values'):
+                raise ValueError(f"Could not fetch sequence A{sequence_id} or sequence has no values")
+        
+            update_progress(f"Found sequence: {sequence_data['title']}")
+            update_progress(f"First values: {', '.join(map(str, sequence_data['values'][:5]))}")
+        
+            # Build sequence network
+            network = await oeis.build_ontology([sequence_id])
+            # build_ontology skips sequences it failed to fetch
+            complete = len(network.get('sequences', [])) == 1
+        
+            # Ensure proper node structure with required values
+            nodes = {}
+            for node_id, data in network.get('nodes', {}).items():
+                values = data.get('values', [])
+                title = data.get('title', '')
+                if values and title:  # Only add nodes with valid data
+                    nodes[node_id] = {
+                        'title': title,
+                        'terms': values[:5],  # Only take first 5 values
+                        'depth': 0 if node_id == sequence_id else 1  # Set depth explicitly
+                    }
+                    update_progress(f"Added node {node_id} with {len(values)} values")
+        
+            # If no valid nodes, create one for the main sequence
+            if not nodes and sequence_data['values']:
+                nodes[sequence_id] = {
+                    'title': sequence_data['title'],
+                    'terms': sequence_data['values'][:5],
+                    'depth': 0
                 }
-                update_progress(f"Added node {node_id} with {len(values)} values")
-        
-        # If no valid nodes, create one for the main sequence
-        if not nodes and sequence_data['values']:
-            nodes[sequence_id] = {
-                'title': sequence_data['title'],
-                'terms': sequence_data['values'][:5],
-                'depth': 0
-            }
-            update_progress("Added main sequence node")
+                update_progress("Added main sequence node")
         
-        if not nodes:
-            raise ValueError("Could not create visualization - no valid sequence data")
+            if not nodes:
+                raise ValueError("Could not create visualization - no valid sequence data")
         
-        # Format network for visualization
-        vis_network = {
-            'nodes': nodes,
-            'edges': network.get('relationships', [])
-        }
+            # Format network for visualization
+            vis_network = {
+                'nodes': nodes,
+                'edges': network.get('relationships', [])
+            }
         
-        update_progress(f"Generated network with {len(vis_network['nodes'])} nodes and {len(vis_network.get('edges', []))} relationships")
-        return vis_network
+            update_progress(f"Generated network with {len(vis_network['nodes'])} nodes and {len(vis_network.get('edges', []))} relationships")
+            if complete:
+                _write_cache(cache_path, vis_network)
+            else:
+                update_progress("Warning: sequence report could not be fetched; network not cached")
+            return vis_network
         
-    except Exception as e:
-        update_progress(f"Error: {str(e)}")
-        raise
+        except Exception as e:
+            update_progress(f"Error: {str(e)}")
+            raise
 
 def main():
     """Run the GUI application."""
@@ -636,6 +1193,10 @@ def main():
     os.environ['QTWEBENGINE_DISABLE_SANDBOX'] = '1'
     os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
     
+    # Qt WebEngine has to be imported before the QApplication exists; the
+    # view itself is only created once a network is displayed
+    from PyQt6 import QtWebEngineWidgets  # noqa: F401
+
     # Create QApplication
     app = QApplication(sys.argv)
     
@@ -653,9 +1214,6 @@ def main():
             os.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'
             os.environ['QT_SCALE_FACTOR'] = '1'
     
-    # Initialize Qt WebEngine before creating window
-    QtWebEngineWidgets.QWebEngineView()
-    
     # Create and show window
     window = CitationNetworkUI()
     window.show()
@@ -11,6 +11,7 @@ Date: 5/01/2025
 import os
 import sys
 import asyncio
+import math
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
@@ -39,6 +40,8 @@ class OEISReportGenerator:
         self.data_dir = data_dir
         self.reports_dir = Paths.ensure_dir(Path(self.data_dir) / "oeis" / "reports")
         self.crawler = OEISCrawler(data_dir)
+        # Fetch tasks for sequence reports by ID; OEIS data doesn't change within a run
+        self._seq_cache = {}
         log.debug(f"Initialized OEISReportGenerator with reports directory: {self.reports_dir}")
     
     async def generate_sequence_report(self, sequence_id: str, output_path=None):
@@ -57,7 +60,7 @@ class OEISReportGenerator:
         sequence_id = sequence_id.lstrip('A')
         
         # Fetch enhanced sequence data
-        sequence_data = await self.crawler.build_sequence_report(sequence_id)
+        sequence_data = await self._get_seq(sequence_id)
         
         # Generate a report file path if not provided
         if output_path is None:
@@ -76,7 +79,7 @@ class OEISReportGenerator:
         report['report_sections']['summary'] = self._generate_summary_section(sequence_data)
         report['report_sections']['mathematical_analysis'] = self._generate_math_analysis(sequence_data)
         report['report_sections']['references'] = self._generate_references_section(sequence_data)
-        report['report_sections']['related_sequences'] = await self._find_related_sequences(sequence_id)
+        report['report_sections']['related_sequences'] = await self._find_related_sequences(sequence_id, sequence_data)
         report['report_sections']['visualizations'] = self._generate_visualizations(sequence_data)
         
         # Save the report
@@ -85,6 +88,30 @@ class OEISReportGenerator:
         
         return output_path
     
+    async def _get_seq(self, sequence_id):
+        """Return the crawler's sequence report for an ID, fetching it only once.
+        
+        Concurrent calls for the same ID await the same task.
+        
+        Args:
+            sequence_id (str): OEIS sequence ID without the 'A' prefix
+            
+        Returns:
+            dict: Enhanced sequence data
+        """
+        task = self._seq_cache.get(sequence_id)
+        if task is None:
+            # Cache the in-flight task so concurrent callers share one fetch
+            task = asyncio.ensure_future(self.crawler.build_sequence_report(sequence_id))
+            self._seq_cache[sequence_id] = task
+        try:
+            return await task
+        except Exception:
+            # Forget failed fetches so a later call can retry
+            if self._seq_cache.get(sequence_id) is task:
+                del self._seq_cache[sequence_id]
+            raise
+    
     def _generate_summary_section(self, sequence_data):
         """Generate a summary section for the report.
         
@@ -137,7 +164,8 @@ class OEISReportGenerator:
         differences = sequence_data.get('differences', [values[i+1] - values[i] for i in range(len(values)-1)])
         analysis['differences'] = differences[:10]  # First 10 differences
         
-        # Calculate ratios if applicable
+        # Calculate ratios if applicable; reused by the geometric check below
+        ratios = None
         if all(v != 0 for v in values[:-1]):  # Avoid division by zero
             ratios = [values[i+1] / values[i] for i in range(len(values)-1)]
             analysis['ratios'] = [round(r, 4) for r in ratios[:10]]  # First 10 ratios
@@ -153,24 +181,22 @@ class OEISReportGenerator:
             })
         
         # Check if geometric
-        if all(values[i] != 0 for i in range(len(values)-1)):
-            ratios = [values[i+1] / values[i] for i in range(len(values)-1)]
-            if len(set([round(r, 10) for r in ratios])) == 1:
-                analysis['sequence_properties'].append({
-                    'type': 'geometric',
-                    'details': f"Common ratio: {round(ratios[0], 4)}"
-                })
+        if ratios is not None and len(set(round(r, 10) for r in ratios)) == 1:
+            analysis['sequence_properties'].append({
+                'type': 'geometric',
+                'details': f"Common ratio: {round(ratios[0], 4)}"
+            })
         
         # Check if matches a^2, a^3, etc.
-        # Check for squares
-        if all(int(v**0.5)**2 == v for v in values):
+        # Check for squares (exact integer roots, no float rounding)
+        if all(v >= 0 and math.isqrt(v)**2 == v for v in values):
             analysis['sequence_properties'].append({
                 'type': 'perfect_squares',
                 'details': f"Terms are perfect squares"
             })
         
         # Check for cubes
-        if all(round(v**(1/3))**3 == v for v in values):
+        if all(self._is_perfect_cube(v) for v in values):
             analysis['sequence_properties'].append({
                 'type': 'perfect_cubes',
                 'details': f"Terms are perfect cubes"
@@ -190,11 +216,37 @@ class OEISReportGenerator:
         
         return analysis
     
-    async def _find_related_sequences(self, sequence_id):
+    @staticmethod
+    def _is_perfect_cube(value):
+        """Return whether an integer is a perfect cube.
+        
+        Uses an integer Newton iteration for the cube root, like math.isqrt
+        for squares, so big terms are neither rounded nor overflow a float.
+        
+        Args:
+            value (int): Sequence term
+            
+        Returns:
+            bool: True if value == r**3 for some integer r
+        """
+        n = abs(value)
+        if n < 2:
+            return True
+        # Start above the cube root; each step then decreases to floor(cbrt(n))
+        root = 1 << -(-n.bit_length() // 3)
+        while True:
+            next_root = (2 * root + n // (root * root)) // 3
+            if next_root >= root:
+                break
+            root = next_root
+        return root**3 == n
+    
+    async def _find_related_sequences(self, sequence_id, sequence_data):
         """Find sequences related to the target sequence.
         
         Args:
             sequence_id (str): OEIS sequence ID
+            sequence_data (dict): Sequence data already fetched for sequence_id
             
         Returns:
             dict: Related sequences data
@@ -202,7 +254,6 @@ class OEISReportGenerator:
         log.debug(f"Finding related sequences for A{sequence_id}")
         
         # Search for related sequences using key terms from the sequence title
-        sequence_data = await self.crawler.build_sequence_report(sequence_id)
         title = sequence_data.get('title', '')
         
         # Extract key terms for searching
@@ -359,14 +410,21 @@ class OEISReportGenerator:
                 seq_list += f"_plus_{len(sequence_ids)-3}"
             output_path = str(self.reports_dir / f"multi_report_{seq_list}_{pd.Timestamp.now().strftime('%Y%m%d')}.parquet")
         
-        # Fetch data for all sequences
+        # Fetch data for all sequences concurrently, a few at a time to spare OEIS
+        semaphore = asyncio.Semaphore(8)
+        
+        async def fetch(seq_id):
+            async with semaphore:
+                return await self._get_seq(seq_id.lstrip('A'))
+        
+        results = await asyncio.gather(*(fetch(seq_id) for seq_id in sequence_ids),
+                                       return_exceptions=True)
         sequences = []
-        for seq_id in sequence_ids:
-            try:
-                data = await self.crawler.build_sequence_report(seq_id.lstrip('A'))
-                sequences.append(data)
-            except Exception as e:
-                log.warning(f"Failed to fetch data for sequence {seq_id}: {str(e)}")
+        for seq_id, result in zip(sequence_ids, results, strict=True):
+            if isinstance(result, Exception):
+                log.warning(f"Failed to fetch data for sequence {seq_id}: {str(result)}")
+            else:
+                sequences.append(result)
         
         # Create report structure
         report = {
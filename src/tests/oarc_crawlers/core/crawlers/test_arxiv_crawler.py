@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import patch, MagicMock
+import asyncio
 import tempfile
+import time
 import io
 import tarfile
 import datetime
@@ -8,6 +10,7 @@ import json
 from pathlib import Path
 
 from oarc_crawlers import ArxivCrawler
+from oarc_crawlers.core.crawlers.arxiv_crawler import _RateLimiter
 
 # Setup fixture to replace setUp/tearDown
 @pytest.fixture
@@ -517,4 +520,84 @@ async def test_extract_math_equations(arxiv_setup):
         # Check display equations
         assert any('y = mx + b' in eq for eq in result['display_equations'])
         assert any('a &= b + c' in eq for eq in result['display_equations'])
-        assert any(r'\int_{-\infty}^{\infty}' in eq for eq in result['display_equations'])
\ No newline at end of file
+        assert any(r'\int_{-\infty}^{\infty}' in eq for eq in result['display_equations'])
+
+
+@pytest.mark.asyncio
+async def test_generate_citation_network(arxiv_setup):
+    """Test that the citation network is crawled level by level."""
+    fetcher = arxiv_setup['fetcher']
+    
+    references = {
+        '2101.00001': [
+            {'key': 'a', 'citation': 'Paper A, arXiv:2101.00002'},
+            {'key': 'b', 'citation': 'Paper B, arXiv:2101.00003'},
+        ],
+        '2101.00002': [{'key': 'c', 'citation': 'Back to the seed, arXiv:2101.00001'}],
+        '2101.00003': [{'key': 'd', 'citation': 'Too deep, arXiv:2101.00004'}],
+    }
+    
+    async def mock_fetch_info(arxiv_id):
+        return {'title': f'Paper {arxiv_id}', 'authors': ['Author'], 'published': '2021-01-01'}
+    
+    async def mock_extract_references(arxiv_id):
+        return {'references': references.get(arxiv_id, [])}
+    
+    with patch.object(fetcher, 'fetch_paper_info', side_effect=mock_fetch_info) as mock_info, \
+         patch.object(fetcher, 'extract_references', side_effect=mock_extract_references), \
+         patch('oarc_crawlers.core.crawlers.arxiv_crawler.ARXIV_REQUEST_INTERVAL', 0), \
+         patch('oarc_crawlers.core.storage.parquet_storage.ParquetStorage.save_to_parquet', return_value=None):
+        network = await fetcher.generate_citation_network(['2101.00001'], max_depth=1)
+    
+    assert network['nodes']['2101.00001']['depth'] == 0
+    assert network['nodes']['2101.00002']['depth'] == 1
+    assert network['nodes']['2101.00003']['depth'] == 1
+    assert '2101.00004' not in network['nodes']
+    assert mock_info.await_count == 3
+    assert network['stats']['edge_count'] == 4
+    assert network['stats']['failed_count'] == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_citation_network_counts_failures(arxiv_setup):
+    """Test that papers which could not be fetched are counted in the stats."""
+    fetcher = arxiv_setup['fetcher']
+    
+    async def mock_fetch_info(arxiv_id):
+        if arxiv_id == '2101.00003':
+            raise ConnectionError("503 Service Unavailable")
+        return {'title': f'Paper {arxiv_id}', 'authors': ['Author'], 'published': '2021-01-01'}
+    
+    async def mock_extract_references(arxiv_id):
+        if arxiv_id == '2101.00002':
+            return {'error': 'Failed to download source: HTTP Error 403'}
+        return {'references': [
+            {'key': 'a', 'citation': 'Paper A, arXiv:2101.00002'},
+            {'key': 'b', 'citation': 'Paper B, arXiv:2101.00003'},
+        ]}
+    
+    with patch.object(fetcher, 'fetch_paper_info', side_effect=mock_fetch_info), \
+         patch.object(fetcher, 'extract_references', side_effect=mock_extract_references), \
+         patch('oarc_crawlers.core.crawlers.arxiv_crawler.ARXIV_REQUEST_INTERVAL', 0), \
+         patch('oarc_crawlers.core.storage.parquet_storage.ParquetStorage.save_to_parquet', return_value=None):
+        network = await fetcher.generate_citation_network(['2101.00001'], max_depth=1)
+    
+    assert '2101.00002' in network['nodes']
+    assert '2101.00003' not in network['nodes']
+    assert network['stats']['failed_count'] == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests():
+    """Test that concurrent waiters on one limiter start an interval apart."""
+    limiter = _RateLimiter(0.05)
+    starts = []
+    
+    async def request():
+        await limiter.wait()
+        starts.append(time.monotonic())
+    
+    await asyncio.gather(*(request() for _ in range(3)))
+    
+    gaps = [starts[i + 1] - starts[i] for i in range(len(starts) - 1)]
+    assert all(gap >= 0.045 for gap in gaps)
@@ -299,4 +299,20 @@ class TestWebCrawler:
             'visited_urls': visited_urls,
             'extracted_pages': extracted_pages,
             'html_content': html_content
-        }
\ No newline at end of file
+        }
+
+    @pytest.mark.asyncio
+    async def test_context_manager_shares_session(self, crawler):
+        """Test that requests inside ``async with`` reuse one pooled session."""
+        assert crawler._session is None
+        async with crawler as entered:
+            assert entered is crawler
+            session = crawler._session
+            assert session is not None
+            with patch.object(crawler, '_fetch_with_session', new_callable=AsyncMock,
+                              return_value="<html></html>") as mock_fetch:
+                await crawler.fetch_url_content("http://example.com/a")
+                await crawler.fetch_url_content("http://example.com/b")
+            assert all(call.args[0] is session for call in mock_fetch.await_args_list)
+        assert crawler._session is None
+        assert session.closed
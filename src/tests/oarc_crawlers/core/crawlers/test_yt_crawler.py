@@ -7,6 +7,20 @@ from datetime import datetime
 from oarc_crawlers.core.crawlers.yt_crawler import YTCrawler
 from oarc_crawlers.utils.crawler_utils import CrawlerUtils
 
+VID_INFO = {
+    "videoDetails": {
+        "title": "Test Video",
+        "author": "Test Author",
+        "channelId": "test",
+        "shortDescription": "Test description",
+        "lengthSeconds": "60",
+        "viewCount": "1000",
+        "averageRating": 4.5,
+        "thumbnail": {"thumbnails": [{"url": "https://img.youtube.com/test"}]},
+        "keywords": ["test", "video"],
+    }
+}
+
 @pytest.fixture
 def crawler():
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -18,17 +32,9 @@ class TestYTCrawler:
 
     def test_extract_video_info(self):
         mock_video = MagicMock()
-        mock_video.title = "Test Video"
         mock_video.video_id = "dQw4w9WgXcQ"
-        mock_video.author = "Test Author"
-        mock_video.channel_url = "https://youtube.com/channel/test"
-        mock_video.description = "Test description"
-        mock_video.length = 60
+        mock_video.vid_info = VID_INFO
         mock_video.publish_date = datetime(2022, 1, 1)
-        mock_video.views = 1000
-        mock_video.rating = 4.5
-        mock_video.thumbnail_url = "https://img.youtube.com/test"
-        mock_video.keywords = ["test", "video"]
         info = CrawlerUtils.extract_video_info(mock_video)
         assert info["title"] == "Test Video"
         assert info["video_id"] == "dQw4w9WgXcQ"
@@ -45,18 +51,12 @@ class TestYTCrawler:
         mock_stream.download.return_value = os.path.join(crawler.data_dir, 'test_video.mp4')
         mock_stream.resolution = "720p"
         mock_stream.mime_type = "video/mp4"
-        mock_yt_instance.streams.filter.return_value.order_by.return_value.desc.return_value.first.return_value = mock_stream
-        mock_yt_instance.title = "Test Video"
+        mock_stream.subtype = "mp4"
+        mock_stream.is_progressive = True
+        mock_yt_instance.streams = [mock_stream]
         mock_yt_instance.video_id = "dQw4w9WgXcQ"
-        mock_yt_instance.author = "Test Author"
-        mock_yt_instance.channel_url = "https://youtube.com/channel/test"
-        mock_yt_instance.description = "Test description"
-        mock_yt_instance.length = 60
+        mock_yt_instance.vid_info = VID_INFO
         mock_yt_instance.publish_date = datetime(2022, 1, 1)
-        mock_yt_instance.views = 1000
-        mock_yt_instance.rating = 4.5
-        mock_yt_instance.thumbnail_url = "https://img.youtube.com/test"
-        mock_yt_instance.keywords = ["test", "video"]
         with patch('os.path.getsize', return_value=1024):
             result = await crawler.download_video("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
             assert result['video_id'] == "dQw4w9WgXcQ"
@@ -69,6 +69,41 @@ class TestParquetStorage(unittest.TestCase):
         self.assertEqual(loaded_df.shape, (3, 2))
         self.assertTrue((loaded_df['col1'] == ['a', 'b', 'c']).all())
     
+    def test_save_string_lists_dictionary_encoded(self):
+        """Test that list-of-string columns are stored dictionary-encoded."""
+        import pyarrow.parquet as pq
+        
+        videos = [
+            {'video_id': 'a', 'keywords': ['music', 'live']},
+            {'video_id': 'b', 'keywords': ['music']},
+            {'video_id': 'c', 'keywords': None},
+        ]
+        result = ParquetStorage.save_to_parquet(videos, self.test_file)
+        self.assertTrue(result)
+        
+        field = pq.read_schema(self.test_file).field('keywords')
+        self.assertEqual(str(field.type.value_type), 'dictionary<values=string, indices=int32, ordered=0>')
+        
+        # Values still round-trip as plain strings
+        loaded_df = pd.read_parquet(self.test_file)
+        self.assertEqual(list(loaded_df['keywords'][0]), ['music', 'live'])
+        self.assertEqual(list(loaded_df['keywords'][1]), ['music'])
+        self.assertIsNone(loaded_df['keywords'][2])
+    
+    def test_memory_pool_fallback(self):
+        """Test that the Arrow memory pool falls back when allocators are missing."""
+        from unittest import mock
+        import pyarrow as pa
+        from oarc_crawlers.core.storage import parquet_storage
+        
+        with mock.patch.object(parquet_storage, '_ARROW_POOL', None), \
+             mock.patch('pyarrow.jemalloc_memory_pool', side_effect=NotImplementedError), \
+             mock.patch('pyarrow.mimalloc_memory_pool', side_effect=NotImplementedError), \
+             mock.patch('pyarrow.set_memory_pool') as mock_set_pool:
+            pool = ParquetStorage._memory_pool()
+        self.assertEqual(pool.backend_name, pa.default_memory_pool().backend_name)
+        mock_set_pool.assert_called_once_with(pool)
+    
     def test_load_from_parquet(self):
         """Test loading data from a parquet file."""
         # First save some data
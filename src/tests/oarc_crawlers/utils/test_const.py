@@ -75,6 +75,8 @@ from oarc_crawlers.utils.const import (
     ARXIV_CATEGORY_MAX_RESULTS,
     ARXIV_CITATION_MAX_DEPTH,
     ARXIV_BATCH_CHUNK_SIZE,
+    ARXIV_NETWORK_CONCURRENCY,
+    ARXIV_REQUEST_INTERVAL,
     GITHUB_BINARY_EXTENSIONS,
     GITHUB_LANGUAGE_EXTENSIONS,
     NLTK_RESOURCES,
@@ -90,7 +92,7 @@ def test_constants_defined():
     # Status constants
     assert SUCCESS == 0
     assert FAILURE == 1
-    assert ERROR == "error"
+    assert ERROR == 1
     assert VERSION == "0.1.5"
     
     # Default values
@@ -181,6 +183,8 @@ def test_constants_defined():
     assert ARXIV_CATEGORY_MAX_RESULTS == 100
     assert ARXIV_CITATION_MAX_DEPTH == 1
     assert ARXIV_BATCH_CHUNK_SIZE == 10
+    assert ARXIV_NETWORK_CONCURRENCY == 3
+    assert ARXIV_REQUEST_INTERVAL == 3.0
     
     # Dictionary constants
     assert isinstance(CONFIG_KEYS, dict)
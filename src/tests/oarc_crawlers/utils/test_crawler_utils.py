@@ -1,6 +1,6 @@
 """Tests for the crawler_utils module."""
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest import mock
 import pytest
 
@@ -44,11 +44,18 @@ def test_format_timestamp():
     assert CrawlerUtils.format_timestamp(test_dt) == "2023-01-01T12:00:00"
     
     # Test with current time
-    with mock.patch("oarc_crawlers.utils.crawler_utils.datetime") as mock_dt:
-        mock_now = mock.MagicMock()
-        mock_now.isoformat.return_value = "2023-02-01T15:30:45"
-        mock_dt.now.return_value = mock_now
-        assert CrawlerUtils.format_timestamp() == "2023-02-01T15:30:45"
+    with mock.patch("oarc_crawlers.utils.crawler_utils.time.time_ns",
+                    return_value=1675265445_123456_000):
+        assert CrawlerUtils.format_timestamp() == "2023-02-01T15:30:45.123456+00:00"
+    
+    # Whole seconds are rendered without a fractional part, like isoformat()
+    with mock.patch("oarc_crawlers.utils.crawler_utils.time.time_ns",
+                    return_value=1675265445_000000_000):
+        assert CrawlerUtils.format_timestamp() == "2023-02-01T15:30:45+00:00"
+    
+    # Current time still matches the datetime-based format
+    now = CrawlerUtils.format_timestamp()
+    assert datetime.fromisoformat(now).tzinfo == timezone.utc
 
 
 def test_file_size_format():
@@ -70,17 +77,21 @@ def test_extract_video_info():
     """Test extracting metadata from YouTube object."""
     # Create mock YouTube object
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_youtube.title = "Test Video"
     mock_youtube.video_id = "test123"
-    mock_youtube.author = "Test Author"
-    mock_youtube.channel_url = "https://youtube.com/channel/test"
-    mock_youtube.description = "Test description"
-    mock_youtube.length = 120
+    mock_youtube.vid_info = {
+        "videoDetails": {
+            "title": "Test Video",
+            "author": "Test Author",
+            "channelId": "test",
+            "shortDescription": "Test description",
+            "lengthSeconds": "120",
+            "viewCount": "1000",
+            "averageRating": 4.5,
+            "thumbnail": {"thumbnails": [{"url": "https://example.com/thumbnail.jpg"}]},
+            "keywords": ["test", "video"],
+        }
+    }
     mock_youtube.publish_date.isoformat.return_value = "2023-01-01T12:00:00"
-    mock_youtube.views = 1000
-    mock_youtube.rating = 4.5
-    mock_youtube.thumbnail_url = "https://example.com/thumbnail.jpg"
-    mock_youtube.keywords = ["test", "video"]
     
     with mock.patch("oarc_crawlers.utils.crawler_utils.CrawlerUtils.format_timestamp", 
                    return_value="2023-02-01T15:30:45"):
@@ -91,7 +102,7 @@ def test_extract_video_info():
     assert result["video_id"] == "test123"
     assert result["url"] == "https://www.youtube.com/watch?v=test123"
     assert result["author"] == "Test Author"
-    assert result["channel_url"] == "https://youtube.com/channel/test"
+    assert result["channel_url"] == "https://www.youtube.com/channel/test"
     assert result["description"] == "Test description"
     assert result["length"] == 120
     assert result["publish_date"] == "2023-01-01T12:00:00"
@@ -102,11 +113,22 @@ def test_extract_video_info():
     assert result["timestamp"] == "2023-02-01T15:30:45"
 
 
+def make_stream(subtype="mp4", resolution=None, progressive=False, audio=True, video=True):
+    """Build a mock pytube Stream with the attributes select_stream inspects."""
+    stream = mock.MagicMock()
+    stream.subtype = subtype
+    stream.resolution = resolution
+    stream.is_progressive = progressive
+    stream.includes_audio_track = audio
+    stream.includes_video_track = video
+    return stream
+
+
 def test_select_stream_audio_only():
     """Test selecting audio stream from YouTube object."""
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_stream = mock.MagicMock()
-    mock_youtube.streams.filter.return_value.first.return_value = mock_stream
+    mock_stream = make_stream(subtype="mp4", video=False)
+    mock_youtube.streams = [make_stream(resolution="720p", progressive=True), mock_stream]
     
     result = CrawlerUtils.select_stream(
         youtube=mock_youtube,
@@ -116,13 +138,12 @@ def test_select_stream_audio_only():
     )
     
     assert result == mock_stream
-    mock_youtube.streams.filter.assert_called_once_with(only_audio=True)
 
 
 def test_select_stream_audio_not_available():
     """Test selecting audio stream when none available."""
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_youtube.streams.filter.return_value.first.return_value = None
+    mock_youtube.streams = [make_stream(resolution="720p", progressive=True)]
     mock_youtube.video_id = "test123"
     
     with pytest.raises(ResourceNotFoundError) as excinfo:
@@ -139,8 +160,13 @@ def test_select_stream_audio_not_available():
 def test_select_stream_highest_resolution():
     """Test selecting highest resolution video stream."""
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_stream = mock.MagicMock()
-    mock_youtube.streams.filter.return_value.order_by.return_value.desc.return_value.first.return_value = mock_stream
+    mock_stream = make_stream(resolution="720p", progressive=True)
+    mock_youtube.streams = [
+        make_stream(resolution="360p", progressive=True),
+        make_stream(resolution="1080p", audio=False),  # adaptive, skipped for mp4
+        mock_stream,
+        make_stream(subtype="webm", resolution="1440p"),
+    ]
     
     result = CrawlerUtils.select_stream(
         youtube=mock_youtube,
@@ -150,14 +176,34 @@ def test_select_stream_highest_resolution():
     )
     
     assert result == mock_stream
-    mock_youtube.streams.filter.assert_called_once_with(progressive=True, file_extension="mp4")
+
+
+def test_select_stream_lowest_resolution():
+    """Test selecting lowest resolution video stream."""
+    mock_youtube = mock.MagicMock(spec=YouTube)
+    mock_stream = make_stream(subtype="webm", resolution="144p", audio=False)
+    mock_youtube.streams = [
+        make_stream(subtype="webm", resolution="720p", audio=False),
+        mock_stream,
+        make_stream(subtype="mp4", resolution="144p", progressive=True),
+        make_stream(subtype="webm", audio=True, video=False),
+    ]
+    
+    result = CrawlerUtils.select_stream(
+        youtube=mock_youtube,
+        video_format="webm",
+        resolution="lowest",
+        extract_audio=False
+    )
+    
+    assert result == mock_stream
 
 
 def test_select_stream_specific_resolution():
     """Test selecting specific resolution video stream."""
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_stream = mock.MagicMock()
-    mock_youtube.streams.filter.return_value.first.return_value = mock_stream
+    mock_stream = make_stream(resolution="720p")
+    mock_youtube.streams = [make_stream(resolution="1080p"), mock_stream]
     
     result = CrawlerUtils.select_stream(
         youtube=mock_youtube,
@@ -167,24 +213,13 @@ def test_select_stream_specific_resolution():
     )
     
     assert result == mock_stream
-    mock_youtube.streams.filter.assert_called_once_with(res="720p", file_extension="mp4")
 
 
 def test_select_stream_specific_resolution_not_available():
     """Test fallback when specific resolution is not available."""
     mock_youtube = mock.MagicMock(spec=YouTube)
-    mock_youtube.streams.filter.side_effect = [
-        mock.MagicMock(first=mock.MagicMock(return_value=None)),
-        mock.MagicMock(order_by=mock.MagicMock(
-            return_value=mock.MagicMock(
-                desc=mock.MagicMock(
-                    return_value=mock.MagicMock(
-                        first=mock.MagicMock(return_value="fallback_stream")
-                    )
-                )
-            )
-        ))
-    ]
+    fallback_stream = make_stream(resolution="1080p")
+    mock_youtube.streams = [make_stream(resolution="480p"), fallback_stream]
     
     result = CrawlerUtils.select_stream(
         youtube=mock_youtube,
@@ -193,8 +228,23 @@ def test_select_stream_specific_resolution_not_available():
         extract_audio=False
     )
     
-    assert result == "fallback_stream"
-    assert mock_youtube.streams.filter.call_count == 2
+    assert result == fallback_stream
+
+
+def test_select_stream_format_not_available():
+    """Test error when no stream matches the requested format."""
+    mock_youtube = mock.MagicMock(spec=YouTube)
+    mock_youtube.streams = [make_stream(subtype="mp4", resolution="720p", progressive=True)]
+    
+    with pytest.raises(ResourceNotFoundError) as excinfo:
+        CrawlerUtils.select_stream(
+            youtube=mock_youtube,
+            video_format="webm",
+            resolution="highest",
+            extract_audio=False
+        )
+    
+    assert "No suitable stream found" in str(excinfo.value)
 
 
 def test_format_chat_message_for_file():
@@ -226,6 +276,12 @@ def test_format_chat_message_for_file():
     
     result = CrawlerUtils.format_chat_message_for_file(message)
     assert result == "[2023-01-01 12:00:00] Test User (✓, 👑): Hello world"
+    
+    # Test sponsor + moderator tags keep their order
+    message.update(is_verified=False, is_chat_owner=False, is_chat_sponsor=True, is_chat_moderator=True)
+    
+    result = CrawlerUtils.format_chat_message_for_file(message)
+    assert result == "[2023-01-01 12:00:00] Test User (💰, 🛡️): Hello world"
 
 
 def test_sanitize_youtube_url():
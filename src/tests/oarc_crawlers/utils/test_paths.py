@@ -19,6 +19,20 @@ def temp_dir():
         shutil.rmtree(temp_dir)
 
 
+@pytest.fixture(autouse=True)
+def clear_path_caches():
+    """Drop cached base directories so each test sees its own environment."""
+    Paths.clear_caches()
+    Paths.invalidate_config_cache()
+    Paths.invalidate_default_base()
+    Paths.reset_ensured_cache()
+    yield
+    Paths.clear_caches()
+    Paths.invalidate_config_cache()
+    Paths.invalidate_default_base()
+    Paths.reset_ensured_cache()
+
+
 def normalize_path(path):
     """Normalize path for platform-independent comparison."""
     return os.path.normpath(path).replace('\\', '/')
@@ -33,24 +47,48 @@ def test_ensure_path(temp_dir):
     assert normalize_path(str(result)) == normalize_path(test_path)
 
 
+def test_ensure_path_skips_known_dirs(temp_dir):
+    """Test that ensure_path only calls mkdir once per directory until it is removed."""
+    test_path = os.path.join(temp_dir, "cached")
+    with mock.patch("oarc_crawlers.utils.paths.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+        Paths.ensure_path(test_path)
+        Paths.ensure_path(pathlib.Path(test_path))
+        assert mock_makedirs.call_count == 1
+        
+        # Removing the tree through Paths forgets it, so it is recreated
+        Paths.cleanup_temp_dir(temp_dir)
+        Paths.ensure_path(test_path)
+    assert os.path.isdir(test_path)
+    assert [c.args[0] for c in mock_makedirs.call_args_list].count(test_path) == 2
+
+
 def test_get_oarc_home_dir():
     """Test retrieving OARC home directory."""
     # Test with environment variable
     with mock.patch.dict(os.environ, {"OARC_HOME_DIR": "/test/path"}):
-        with mock.patch("pathlib.Path.resolve", return_value=pathlib.Path("/test/path")):
+        with mock.patch("pathlib.Path.resolve") as mock_resolve:
             result = Paths.get_oarc_home_dir()
             assert normalize_path(str(result)) == normalize_path("/test/path")
+            mock_resolve.assert_not_called()
+    
+    # Test relative environment variable is made absolute
+    Paths.clear_caches()
+    with mock.patch.dict(os.environ, {"OARC_HOME_DIR": "relative/home"}):
+        result = Paths.get_oarc_home_dir()
+        assert result.is_absolute()
+        assert normalize_path(str(result)) == normalize_path(os.path.join(os.getcwd(), "relative/home"))
     
     # Test default behavior
+    Paths.clear_caches()
     with mock.patch.dict(os.environ, clear=True):
-        with mock.patch("pathlib.Path.home", return_value=pathlib.Path("/home/user")):
+        with mock.patch("os.path.expanduser", return_value="/home/user"):
             result = Paths.get_oarc_home_dir()
             assert normalize_path(str(result)) == normalize_path("/home/user")
 
 
 def test_get_oarc_dir():
     """Test retrieving .oarc directory."""
-    with mock.patch("oarc_crawlers.utils.paths.Paths.get_oarc_home_dir", 
+    with mock.patch("oarc_crawlers.utils.paths.get_oarc_home_dir", 
                    return_value=pathlib.Path("/home/user")):
         result = Paths.get_oarc_dir()
         assert normalize_path(str(result)) == normalize_path("/home/user/.oarc")
@@ -60,22 +98,40 @@ def test_get_default_data_dir():
     """Test retrieving default data directory."""
     # Test with environment variable
     with mock.patch.dict(os.environ, {"OARC_DATA_DIR": "/test/data"}):
-        with mock.patch("pathlib.Path.resolve", return_value=pathlib.Path("/test/data")):
+        with mock.patch("pathlib.Path.resolve") as mock_resolve:
             result = Paths.get_default_data_dir()
             assert normalize_path(str(result)) == normalize_path("/test/data")
+            mock_resolve.assert_not_called()
     
     # Test default behavior
+    Paths.clear_caches()
     with mock.patch.dict(os.environ, clear=True):
-        with mock.patch("oarc_crawlers.utils.paths.Paths.get_oarc_dir", 
+        with mock.patch("oarc_crawlers.utils.paths.get_oarc_dir", 
                        return_value=pathlib.Path("/home/user/.oarc")):
             result = Paths.get_default_data_dir()
             assert normalize_path(str(result)) == normalize_path("/home/user/.oarc/data")
 
 
+def test_base_dirs_are_cached():
+    """Test that base directories are resolved once until caches are cleared."""
+    with mock.patch.dict(os.environ, {"OARC_HOME_DIR": "/first", "OARC_DATA_DIR": "/first/data"}):
+        first_home = Paths.get_oarc_home_dir()
+        first_data = Paths.get_default_data_dir()
+    
+    with mock.patch.dict(os.environ, {"OARC_HOME_DIR": "/second", "OARC_DATA_DIR": "/second/data"}):
+        assert Paths.get_oarc_home_dir() is first_home
+        assert Paths.get_default_data_dir() is first_data
+        
+        Paths.clear_caches()
+        assert normalize_path(str(Paths.get_oarc_home_dir())).endswith("/second")
+        assert normalize_path(str(Paths.get_oarc_dir())).endswith("/second/.oarc")
+        assert normalize_path(str(Paths.get_default_data_dir())).endswith("/second/data")
+
+
 def test_get_temp_dir():
     """Test retrieving temporary directory."""
     with mock.patch("tempfile.gettempdir", return_value="/tmp"):
-        with mock.patch("oarc_crawlers.utils.paths.Paths.ensure_path") as mock_ensure:
+        with mock.patch("oarc_crawlers.utils.paths.ensure_path") as mock_ensure:
             mock_ensure.return_value = pathlib.Path("/tmp/oarc-crawlers")
             result = Paths.get_temp_dir()
             assert normalize_path(str(result)) == normalize_path("/tmp/oarc-crawlers")
@@ -93,6 +149,9 @@ def test_sanitize_filename():
     # Test trimming
     assert Paths.sanitize_filename(" trim_spaces ") == "trim_spaces"
     
+    # Test trimming happens before spaces and invalid characters are replaced
+    assert Paths.sanitize_filename("\t a\\b <c> \n") == "a_b__c_"
+    
     # Test long filename
     long_name = "a" * 300
     assert len(Paths.sanitize_filename(long_name)) == 250
@@ -100,8 +159,7 @@ def test_sanitize_filename():
 
 def test_timestamped_path(temp_dir):
     """Test creating a timestamped path."""
-    with mock.patch("oarc_crawlers.utils.paths.datetime") as mock_dt:
-        mock_dt.now.return_value.timestamp.return_value = 1234567890
+    with mock.patch("oarc_crawlers.utils.paths.time.time_ns", return_value=1234567890_123456789):
         
         # Test with extension
         result = Paths.timestamped_path(temp_dir, "test_file", "txt")
@@ -141,7 +199,7 @@ def test_ensure_parent_dir(temp_dir):
     assert os.path.exists(os.path.dirname(test_file_path))
     
     # Test error handling
-    with mock.patch("oarc_crawlers.utils.paths.Paths.ensure_path", 
+    with mock.patch("oarc_crawlers.utils.paths.ensure_path", 
                   side_effect=PermissionError("Permission denied")):
         success, error = Paths.ensure_parent_dir(test_file_path)
         assert success is False
@@ -191,7 +249,7 @@ def test_ensure_temp_dir(temp_dir):
             mock_rmtree.assert_called_once_with(pathlib.Path(temp_dir))
     
     # Test with new directory creation
-    with mock.patch("oarc_crawlers.utils.paths.Paths.create_temp_dir") as mock_create:
+    with mock.patch("oarc_crawlers.utils.paths.create_temp_dir") as mock_create:
         mock_create.return_value = pathlib.Path("/tmp/new_temp_dir")
         result = Paths.ensure_temp_dir()
         assert normalize_path(str(result)) == normalize_path("/tmp/new_temp_dir")
@@ -244,6 +302,78 @@ def test_youtube_data_dir():
         result = Paths.youtube_data_dir()
         assert normalize_path(str(result)) == normalize_path("/config/data/youtube_data")
         
+        # The Config lookup is cached until invalidated
+        mock_config.return_value.data_dir = "/other/data"
+        result = Paths.youtube_data_dir()
+        assert normalize_path(str(result)) == normalize_path("/config/data/youtube_data")
+        assert mock_config.call_count == 1
+        
+        Paths.invalidate_default_base()
+        result = Paths.youtube_data_dir()
+        assert normalize_path(str(result)) == normalize_path("/other/data/youtube_data")
+        
         # Test with custom base dir
         result = Paths.youtube_data_dir("/custom/base")
         assert normalize_path(str(result)) == normalize_path("/custom/base/youtube_data")
+
+
+def test_get_default_config_locations():
+    """Test the default config locations are plain path strings."""
+    with mock.patch.dict(os.environ, {"OARC_HOME_DIR": "/home/oarc"}):
+        with mock.patch("os.getcwd", return_value="/work"):
+            locations = Paths.get_default_config_locations()
+    
+    assert all(isinstance(location, str) for location in locations)
+    assert [normalize_path(location) for location in locations[:2]] == [
+        normalize_path("/work/crawlers.ini"),
+        normalize_path("/home/oarc/.oarc/config/crawlers.ini"),
+    ]
+
+
+def test_find_config_file(temp_dir):
+    """Test finding a config file and caching the result."""
+    missing = pathlib.Path(temp_dir, "missing.ini")
+    config_file = pathlib.Path(temp_dir, "crawlers.ini")
+    locations = (str(missing), str(config_file))
+    
+    with mock.patch("oarc_crawlers.utils.paths.get_default_config_locations",
+                    return_value=locations) as mock_locations:
+        # Nothing on disk yet; the negative result is cached too
+        assert Paths.find_config_file() is None
+        config_file.write_text("[oarc-crawlers]\n")
+        assert Paths.find_config_file() is None
+        assert mock_locations.call_count == 1
+        
+        # Invalidating picks up the newly written file
+        Paths.invalidate_config_cache()
+        assert Paths.find_config_file() == config_file
+        assert Paths.find_config_file() == config_file
+        assert mock_locations.call_count == 2
+
+
+def test_youtube_subdirs_created_once(temp_dir):
+    """Test that each YouTube subdirectory is created at most once per base dir."""
+    youtube_dir = os.path.join(temp_dir, "youtube_data")
+    with mock.patch("oarc_crawlers.utils.paths.os.makedirs", wraps=os.makedirs) as mock_makedirs, \
+         mock.patch("oarc_crawlers.utils.paths.os.mkdir", wraps=os.mkdir) as mock_mkdir:
+        first = Paths.youtube_videos_dir(temp_dir)
+        second = Paths.youtube_videos_dir(temp_dir)
+        Paths.youtube_captions_dir(temp_dir)
+    
+    assert first == second == pathlib.Path(youtube_dir, "videos")
+    # The shared parent is ensured once; each leaf is a single mkdir
+    mock_makedirs.assert_called_once_with(youtube_dir, exist_ok=True)
+    mkdir_paths = [c.args[0] for c in mock_mkdir.call_args_list]
+    assert mkdir_paths.count(os.path.join(youtube_dir, "videos")) == 1
+    assert mkdir_paths.count(os.path.join(youtube_dir, "captions")) == 1
+
+
+def test_ensure_path_leaf(temp_dir):
+    """Test creating a single directory inside an existing parent."""
+    result = Paths.ensure_path_leaf(temp_dir, "leaf")
+    assert result == pathlib.Path(temp_dir, "leaf")
+    assert os.path.isdir(result)
+    
+    # Existing directories are accepted
+    Paths.reset_ensured_cache()
+    assert Paths.ensure_path_leaf(temp_dir, "leaf") == result